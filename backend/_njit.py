@@ -0,0 +1,18 @@
+"""
+Optional Numba JIT
+
+Kernels decorate themselves with `njit` from here. When numba is not
+installed the decorator is a no-op and the kernels run as plain Python.
+"""
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
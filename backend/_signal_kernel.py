@@ -0,0 +1,61 @@
+"""
+Compiled two-way entry signal kernel for the tick backtester
+
+Threshold logic of TickBacktester._get_tick_signal on plain floats, so it
+can be compiled with Numba (see _njit.py).
+"""
+from _njit import njit
+
+# Action codes
+HOLD = 0
+BOTH = 1
+CLOSE = 2
+
+# Entry: hybrid/ATR volatility as % of price, BB center band
+HYBRID_PCT_MIN = 0.04
+ATR_PCT_MIN = 0.15
+BB_ENTRY_LOW = 0.40
+BB_ENTRY_HIGH = 0.60
+
+# Exit: volatility collapse (hybrid < 5% of ATR) or extreme BB position
+VOL_COLLAPSE_RATIO = 0.05
+BB_EXIT_LOW = 0.15
+BB_EXIT_HIGH = 0.85
+
+# Close reasons reported by the kernel
+CLOSE_VOL_COLLAPSE = 1
+CLOSE_EXTREME_BB = 2
+
+
+@njit(cache=True)
+def signal_kernel(hybrid_vol, atr_vol, bb_position, current_price, has_positions):
+    """Decide the two-way entry action
+
+    Args:
+        hybrid_vol: Hybrid volatility ($)
+        atr_vol: ATR-like volatility ($)
+        bb_position: Position within the Bollinger Bands (0 = lower, 1 = upper)
+        current_price: Current price
+        has_positions: Whether the symbol has open positions
+
+    Returns:
+        (action, close_reason, hybrid_pct, atr_pct)
+    """
+    hybrid_pct = 0.0
+    atr_pct = 0.0
+
+    if atr_vol > 0 and hybrid_vol > 0:
+        hybrid_pct = (hybrid_vol / current_price) * 100
+        atr_pct = (atr_vol / current_price) * 100
+
+        if hybrid_pct >= HYBRID_PCT_MIN and atr_pct >= ATR_PCT_MIN:
+            if BB_ENTRY_LOW < bb_position < BB_ENTRY_HIGH:
+                return BOTH, 0, hybrid_pct, atr_pct
+
+    if has_positions:
+        if hybrid_vol < atr_vol * VOL_COLLAPSE_RATIO:
+            return CLOSE, CLOSE_VOL_COLLAPSE, hybrid_pct, atr_pct
+        if bb_position < BB_EXIT_LOW or bb_position > BB_EXIT_HIGH:
+            return CLOSE, CLOSE_EXTREME_BB, hybrid_pct, atr_pct
+
+    return HOLD, 0, hybrid_pct, atr_pct
@@ -0,0 +1,66 @@
+"""
+Compiled two-way entry score for TradingStrategy
+
+BB compression / ATR expansion rule of
+TradingStrategy.analyze_technical_signals on plain floats, so it can be
+compiled with Numba (see _njit.py).
+"""
+from _njit import njit
+
+
+@njit(cache=True)
+def straddle_score(bb_bandwidth, atr_pct, bb_threshold, atr_threshold):
+    """Two-way entry signal from BB compression and ATR expansion
+
+    Args:
+        bb_bandwidth: Bollinger bandwidth
+        atr_pct: ATR as a fraction of price
+        bb_threshold: Coin-specific compression threshold
+        atr_threshold: Coin-specific expansion threshold
+
+    Returns:
+        (signal, strength): 2 (BOTH) or 0 (HOLD), strength 0-1
+    """
+    # Coin-specific compression / expansion thresholds
+    is_compressed = bb_bandwidth < bb_threshold
+    is_expanding = atr_pct > atr_threshold
+    has_volume = True  # Volume filter disabled (v5.0), always pass for now
+
+    signal = 0
+    strength = 0.0
+
+    # TWO-WAY ONLY STRATEGY: Only enter both sides simultaneously
+    # Do NOT use traditional BUY/SELL signals
+
+    # Entry signal: Volatility compression → expansion + volume confirmation (v5.0)
+    if is_compressed and is_expanding and has_volume:
+        signal = 2  # Special code: BOTH (LONG + SHORT simultaneously)
+
+        # Calculate strength based on:
+        # - Degree of compression (tighter = stronger)
+        # - Degree of expansion (larger ATR = stronger)
+        # - Combination confidence
+
+        # Use coin-specific thresholds for strength calculation (v4.0 fix)
+        # This ensures low-ATR coins (BTC, ETH) get proper strength scores
+        compression_strength = max(0, (bb_threshold - bb_bandwidth) / bb_threshold) if bb_threshold > 0 else 0
+        expansion_strength = min(atr_pct / atr_threshold, 1.0) if atr_threshold > 0 else 0
+
+        # Combine signals (equal weight)
+        strength = (compression_strength * 0.5 + expansion_strength * 0.5)
+
+        # Boost strength if both conditions are very strong
+        if compression_strength > 0.7 and expansion_strength > 0.7:
+            strength = min(strength * 1.2, 1.0)
+
+    # NOTE: signal = 0 (HOLD) if conditions not met
+    # NO traditional BUY (1) or SELL (-1) signals in this strategy
+
+    return signal, min(strength, 1.0)
+
+
+# Compile (or load from the on-disk cache) at import so the first
+# generate_signal() on a live tick doesn't pay the JIT cost. Same float64
+# signature analyze_technical_signals calls with. Errors propagate: a kernel
+# that fails to compile should fail the import, not the first live tick.
+straddle_score(0.05, 0.03, 0.055, 0.025)
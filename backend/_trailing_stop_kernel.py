@@ -0,0 +1,74 @@
+"""
+Compiled trailing stop updater for the tick backtester
+
+TrailingStopManager.update_trailing_stop rules applied to a block of
+position slots on plain arrays, so it can be compiled with Numba (see
+_njit.py). LONG and SHORT share one code path through the slot sign.
+"""
+import numpy as np
+
+from _njit import njit
+
+
+@njit(cache=True)
+def update_trailing_stops(
+    price,
+    volatility,
+    base_multiplier,
+    stop_distance,
+    min_profit_threshold,
+    acceleration_step,
+    active,
+    sign,
+    entry_price,
+    peak,
+    stop_price
+):
+    """Move peaks and stops of the active slots, in place
+
+    Args:
+        price: Current price
+        volatility: Tick volatility ($, ATR proxy)
+        base_multiplier: ATR multiplier for the current volatility band
+        stop_distance: Hard stop distance as a fraction of entry price
+        min_profit_threshold: Profit above which the stop starts tightening
+        acceleration_step: Tightening rate per unit of extra profit
+        active: Slot in use (bool)
+        sign: +1.0 LONG, -1.0 SHORT
+        entry_price: Entry price per slot
+        peak: Best price since entry per slot (updated)
+        stop_price: Stop price per slot (updated)
+
+    Returns:
+        Bool mask of slots whose stop (trailing or hard) was hit
+    """
+    hit = np.zeros(len(active), dtype=np.bool_)
+
+    for i in range(len(active)):
+        if not active[i]:
+            continue
+        s = sign[i]
+        entry = entry_price[i]
+
+        # In sign-adjusted price space both sides trail the running maximum
+        new_peak = s * max(s * peak[i], s * price)
+        profit_pct = s * (price - entry) / entry
+
+        # Tighten the ATR multiplier once in profit
+        multiplier = base_multiplier
+        if profit_pct > min_profit_threshold:
+            tightening = (profit_pct - min_profit_threshold) * acceleration_step * 10
+            multiplier = max(1.0, base_multiplier - tightening)
+            if profit_pct > 0.02:
+                multiplier = max(0.8, multiplier - 0.5)
+
+        # Trailing stop, clamped by the hard stop price
+        trail = new_peak - s * (multiplier * volatility)
+        hard_stop_price = entry * (1 - s * stop_distance)
+        new_stop = s * max(s * trail, s * hard_stop_price)
+
+        peak[i] = new_peak
+        stop_price[i] = new_stop
+        hit[i] = profit_pct < -stop_distance or s * (price - new_stop) <= 0
+
+    return hit
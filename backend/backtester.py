@@ -176,10 +176,11 @@ class Backtester:
         )
         indicators['close'] = float(history['close'].iloc[-1])
 
-        # Generate signal (with coin-specific parameters)
-        signal = self.strategy.generate_signal(history, indicators, symbol)
+        # Generate signal (with coin-specific parameters), stamped with the bar time
+        signal = self.strategy.generate_signal(
+            history, indicators, symbol, timestamp=history['timestamp'].iloc[-1]
+        )
         signal['price'] = float(history['close'].iloc[-1])
-        signal['timestamp'] = history['timestamp'].iloc[-1]
         signal['atr'] = indicators.get('atr', signal['price'] * 0.02)
 
         return signal
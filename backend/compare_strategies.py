@@ -59,8 +59,8 @@ class SelectiveTickBacktester(TickBacktester):
             if hybrid_pct >= 0.08 and atr_pct >= 0.30:  # 2x stricter
                 if 0.48 < bb_position < 0.52:  # Very tight center
                     if abs(momentum) > 0.0001:  # Must have momentum
-                        # Check cooldown
-                        current_time = datetime.now().timestamp()
+                        # Check cooldown (simulated tick time, not wall clock)
+                        current_time = self._now_ns / 1e9
                         last_time = self.last_entry_time.get(symbol, 0)
 
                         if current_time - last_time >= self.cooldown_seconds:
@@ -74,8 +74,7 @@ class SelectiveTickBacktester(TickBacktester):
                             }
 
         # Exit logic (same as Strategy A)
-        has_positions = any(p['symbol'] == symbol for p in self.positions.values())
-        if has_positions:
+        if self._has_positions(symbol):
             if hybrid_vol < atr_vol * 0.05:
                 return {
                     'action': 'CLOSE',
@@ -9,9 +9,16 @@ from typing import Dict, List, Optional, Tuple
 import logging
 import pickle
 import os
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Predictions kept per engine, keyed by the exact feature row
+PREDICTION_CACHE_SIZE = 4096
+
+# OHLCV columns prepare_features reads
+OHLCV_COLUMNS = ('close', 'volume', 'high', 'low')
+
 class MLEngine:
     """Machine Learning engine for trading signal prediction"""
 
@@ -25,6 +32,7 @@ class MLEngine:
         self.rf_model = None
         self.scaler = StandardScaler()
         self.feature_names = []
+        self._predict_cached = lru_cache(maxsize=PREDICTION_CACHE_SIZE)(self._predict_row)
 
         # Create models directory if it doesn't exist
         os.makedirs(model_path, exist_ok=True)
@@ -168,6 +176,7 @@ class MLEngine:
         )
 
         self.rf_model.fit(X_scaled, y)
+        self._predict_cached.cache_clear()
 
         # Calculate training metrics
         train_score = self.rf_model.score(X_scaled, y)
@@ -193,6 +202,24 @@ class MLEngine:
 
         return metrics
 
+    def can_predict(self, data: pd.DataFrame) -> bool:
+        """Cheap check that predict() has a model and usable OHLCV data
+
+        Lets callers skip predict() on warm-up or incomplete data instead of
+        relying on it raising.
+
+        Args:
+            data: Current OHLCV data
+
+        Returns:
+            True if a model is loaded and data has rows and the OHLCV columns
+        """
+        return (
+            self.rf_model is not None
+            and not data.empty
+            and all(column in data.columns for column in OHLCV_COLUMNS)
+        )
+
     def predict(self, data: pd.DataFrame, indicators: Dict) -> Tuple[int, float]:
         """Predict trading signal using trained model
 
@@ -208,19 +235,47 @@ class MLEngine:
         if self.rf_model is None:
             raise ValueError("Model not trained yet. Call train_model() first.")
 
-        # Prepare features
+        # Prepare features; identical rows reuse the cached prediction
         features = self.prepare_features(data, indicators)
-        X = features.iloc[-1:].values
+        X = features.iloc[-1:].to_numpy(dtype=np.float64)
+        return self._predict_cached(tuple(self.feature_names), X.tobytes())
+
+    def _predict_row(self, feature_names: Tuple[str, ...], row: bytes) -> Tuple[int, float]:
+        """Model prediction for one feature row (feature_names only keys the cache)"""
+        X = np.frombuffer(row, dtype=np.float64).reshape(1, -1)
 
         # Scale features
         X_scaled = self.scaler.transform(X)
 
         # Predict
-        prediction = self.rf_model.predict(X_scaled)[0]
-        probabilities = self.rf_model.predict_proba(X_scaled)[0]
-        confidence = probabilities.max()
+        predictions, confidences = self._predict_scaled(X_scaled)
+        return int(predictions[0]), float(confidences[0])
 
-        return int(prediction), float(confidence)
+    def predict_batch(self, features: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict trading signals for many feature rows at once
+
+        Args:
+            features: One row per prediction, with (at least) the model's
+                feature_names as columns, as built by prepare_features
+
+        Returns:
+            Tuple of (signals, confidences) arrays
+        """
+        if self.rf_model is None:
+            raise ValueError("Model not trained yet. Call train_model() first.")
+
+        X = features[self.feature_names].to_numpy(dtype=np.float64)
+        return self._predict_scaled(self.scaler.transform(X))
+
+    def _predict_scaled(self, X_scaled: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(predicted classes, max class probabilities) from one forest pass
+
+        RandomForestClassifier.predict is the argmax of predict_proba, so the
+        classes are taken from the probabilities instead of a second pass.
+        """
+        probabilities = self.rf_model.predict_proba(X_scaled)
+        predictions = self.rf_model.classes_.take(np.argmax(probabilities, axis=1))
+        return predictions, probabilities.max(axis=1)
 
     def save_model(self, filename: str = "rf_model.pkl"):
         """Save trained model to disk
@@ -260,6 +315,7 @@ class MLEngine:
         self.rf_model = model_data['rf_model']
         self.scaler = model_data['scaler']
         self.feature_names = model_data['feature_names']
+        self._predict_cached.cache_clear()
 
         logger.info(f"Model loaded from {filepath}")
 
@@ -17,7 +17,7 @@ from pathlib import Path
 import ccxt.async_support as ccxt
 
 from binance_client import BinanceClient
-from tick_data_collector import TickDataCollector, Tick
+from tick_data_collector import TickDataCollector, Tick, run_event_loop
 from tick_indicators import TickIndicators
 from trailing_stop_manager import TrailingStopManager
 
@@ -438,4 +438,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
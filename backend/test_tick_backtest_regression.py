@@ -0,0 +1,87 @@
+"""
+Regression test for TickBacktester on a fixed synthetic tick series
+Pins the exact trades and final balance, so any rewrite of the tick loop,
+indicators or kernels that changes a single result bit fails here
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from tick_backtester import TickBacktester
+from tick_data_collector import Tick
+
+# Produced by the backtester before the array/kernel rewrite and unchanged since
+EXPECTED_TRADES = 410
+EXPECTED_FINAL_BALANCE = 8885.47496919221
+EXPECTED_TRADES_HASH = '9823997f4b6925c520bae4631e991f1e'
+EXPECTED_EQUITY_POINTS = 120
+
+TICKS_PER_SYMBOL = 6000
+
+
+def make_ticks(symbol: str, n: int, base_price: float, seed: int):
+    """Random-walk ticks at 100ms spacing with regime-switching volatility"""
+    rng = np.random.default_rng(seed)
+    start = datetime(2025, 10, 17)
+    offset_ms = 7 if symbol.startswith('E') else 0
+    steps = rng.standard_normal(n) * base_price * 0.0004
+    regime = np.repeat(rng.uniform(0.3, 2.5, n // 2000 + 1), 2000)[:n]
+    prices = base_price + np.cumsum(steps * regime)
+    return [
+        Tick(
+            symbol=symbol,
+            timestamp=start + timedelta(milliseconds=100 * i + offset_ms),
+            price=float(price),
+            bid=float(price) - 0.5,
+            ask=float(price) + 0.5,
+            bid_qty=1.0,
+            ask_qty=1.0,
+            volume_24h=1000.0 + i * 0.01,
+            quote_volume_24h=5e7,
+            price_change_pct=0.1
+        )
+        for i, price in enumerate(prices)
+    ]
+
+
+def trades_hash(trades: list) -> str:
+    """Digest of every trade's outcome (floats compared exactly via repr)"""
+    rows = [
+        (t['symbol'], t['type'], t['entry_price'], t['exit_price'], t['size'],
+         t['fees'], t['pnl'], t['reason'], t['entry_time'], t['exit_time'],
+         t['balance_after'])
+        for t in trades
+    ]
+    return hashlib.md5(json.dumps(rows).encode()).hexdigest()
+
+
+async def run_synthetic_backtest() -> dict:
+    """Backtest two synthetic symbols with the default TickBacktester settings"""
+    tick_data = {
+        'BTC/USDT': make_ticks('BTC/USDT', TICKS_PER_SYMBOL, 50000.0, 1),
+        'ETH/USDT': make_ticks('ETH/USDT', TICKS_PER_SYMBOL, 2500.0, 2)
+    }
+    backtester = TickBacktester(symbols=list(tick_data))
+    return await backtester.run_backtest(tick_data, progress_interval=10**9)
+
+
+def test_synthetic_backtest_regression():
+    logging.disable(logging.INFO)
+    try:
+        results = asyncio.run(run_synthetic_backtest())
+    finally:
+        logging.disable(logging.NOTSET)
+
+    assert results['total_trades'] == EXPECTED_TRADES
+    assert results['final_balance'] == EXPECTED_FINAL_BALANCE
+    assert len(results['equity_curve']) == EXPECTED_EQUITY_POINTS
+    assert trades_hash(results['trades']) == EXPECTED_TRADES_HASH
+
+
+if __name__ == "__main__":
+    test_synthetic_backtest_regression()
+    print("✅ Synthetic backtest matches the pinned trades and balance")
@@ -6,18 +6,30 @@ CRITICAL RULE: NO candle data. Only tick data.
 Simulates trading as if receiving real-time tick stream.
 """
 import asyncio
-import json
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import List, Dict, Optional, Union
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import orjson
 from dataclasses import asdict
 
+try:
+    import pyarrow as pa
+    import pyarrow.json as pa_json
+    import pyarrow.parquet as pq
+except ImportError:  # optional: falls back to the orjson line parser
+    pa = pa_json = pq = None
+
 from tick_data_collector import Tick, TickDataCollector
 from tick_indicators import TickIndicators
 from trailing_stop_manager import TrailingStopManager
+from _signal_kernel import signal_kernel, BOTH, CLOSE, CLOSE_VOL_COLLAPSE
+from _trailing_stop_kernel import update_trailing_stops
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +38,242 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Closed trades, appended one row per close (materialized as dicts for output)
+TRADE_DTYPE = np.dtype([
+    ('position_key', np.int64),
+    ('symbol_id', np.int32),
+    ('is_long', np.uint8),
+    ('entry_price', np.float64),
+    ('exit_price', np.float64),
+    ('size', np.float64),
+    ('pnl_gross', np.float64),
+    ('fees', np.float64),
+    ('pnl', np.float64),
+    ('pnl_pct', np.float64),
+    ('entry_ns', np.int64),
+    ('exit_ns', np.int64),
+    ('reason_id', np.int32),     # index into TickBacktester._reasons
+    ('balance_after', np.float64)
+])
+
+
+def _datetime_to_ns(timestamp: datetime) -> int:
+    """Convert a (naive) datetime to int64 nanoseconds since epoch"""
+    return int(np.datetime64(timestamp, 'ns').astype(np.int64))
+
+
+def _datetimes_to_ns(timestamps: List[datetime]) -> np.ndarray:
+    """Vectorized datetime -> int64 nanoseconds conversion"""
+    return np.array(timestamps, dtype='datetime64[ns]').astype(np.int64)
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """int64 nanoseconds -> naive datetime (for logging)"""
+    return np.datetime64(int(ns), 'ns').astype('datetime64[us]').item()
+
+
+TICK_BUFFER_SIZE = 10000
+TICK_BATCH_SIZE = 1000
+SIGNAL_WINDOW_SIZE = 1000  # ticks fed to the signal indicators (~100 seconds)
+SIGNAL_LOOKBACK_SECONDS = 600  # time window applied within those ticks
+SIGNAL_WARMUP_TICKS = 100    # no signals until a symbol has this many ticks
+SIGNAL_INTERVAL_TICKS = 10   # generate signals every 10 ticks (~1 second)
+EQUITY_INTERVAL_TICKS = 100  # record equity every 100 ticks (~10 seconds)
+STOP_VOLATILITY_TICKS = 100  # trailing stop ATR proxy: last 100 ticks...
+STOP_VOLATILITY_LOOKBACK = 60  # ...within the last 60 seconds
+
+
+# Columns kept per symbol in the tick ring buffer (and returned by
+# load_tick_arrays_from_file)
+TICK_COLUMNS = {
+    'ts': np.int64,
+    'price': np.float64,
+    'volume': np.float64,  # volume_24h (VWAP weight)
+    'bid': np.float64,
+    'ask': np.float64
+}
+
+LOADER_BUFFER_BYTES = 1 << 20  # 1 MiB read buffer
+LOADER_CHUNK_ROWS = 65536      # column growth step while loading
+
+
+def _num_ticks(ticks: Union[List[Tick], Dict[str, np.ndarray]]) -> int:
+    """Tick count of a List[Tick] or a TICK_COLUMNS dict"""
+    if isinstance(ticks, dict):
+        return len(ticks['ts'])
+    return len(ticks)
+
+
+def _grow(arr: np.ndarray, capacity: int) -> np.ndarray:
+    """Return a copy of arr with a larger capacity (std::vector-style growth)"""
+    grown = np.empty(capacity, dtype=arr.dtype)
+    grown[:len(arr)] = arr
+    return grown
+
+
+def _ns_to_iso(ns_values) -> List[str]:
+    """Vectorized int64 nanoseconds -> ISO 8601 strings
+
+    Same text as datetime.isoformat(): microsecond precision, with the
+    fraction dropped when it is zero.
+    """
+    if len(ns_values) == 0:
+        return []
+    us = np.asarray(ns_values, dtype=np.int64).astype('datetime64[ns]').astype('datetime64[us]')
+    return [
+        iso[:-7] if iso.endswith('.000000') else iso
+        for iso in np.datetime_as_string(us, unit='us').tolist()
+    ]
+
+
+def _symbol_signal_indicators(indicators_cls, ts, price, volume, bid, ask) -> List[dict]:
+    """compute_all for every signal tick of one symbol (see run_backtest)
+
+    Indicators only depend on the symbol's own tick window, never on
+    trading state, so they can be computed ahead of the sequential loop.
+    Entry i belongs to the symbol's tick number
+    SIGNAL_WARMUP_TICKS + i * SIGNAL_INTERVAL_TICKS.
+    """
+    indicators = []
+    for count in range(SIGNAL_WARMUP_TICKS, len(price) + 1, SIGNAL_INTERVAL_TICKS):
+        window = slice(max(0, count - SIGNAL_WINDOW_SIZE), count)
+        indicators.append(indicators_cls.compute_all(
+            price[window],
+            ts[window],
+            volume[window],
+            bid[window],
+            ask[window],
+            lookback_seconds=SIGNAL_LOOKBACK_SECONDS
+        ))
+    return indicators
+
+
+def _run_symbol_leg(backtester_cls, symbol: str, ticks, config: dict) -> dict:
+    """Backtest a single symbol in a worker process (see run_split_capital_backtest)"""
+    leg = backtester_cls(symbols=[symbol], **config)
+    asyncio.run(leg.run_backtest({symbol: ticks}, progress_interval=_num_ticks(ticks) + 1))
+    n = leg._eq_n
+    return {
+        'balance': leg.balance,
+        'total_fees_paid': leg.total_fees_paid,
+        'trades': leg._trades[:leg._trade_n].copy(),
+        'reasons': leg._reasons,
+        'eq_ts': leg._eq_ts[:n].copy(),
+        'eq_bal': leg._eq_bal[:n].copy(),
+        'eq_upnl': leg._eq_upnl[:n].copy(),
+        'eq_npos': leg._eq_npos[:n].copy()
+    }
+
+
+class RollingTickVolatility:
+    """Std of absolute tick-to-tick price changes over the last N ticks
+
+    Sliding-window Welford update, O(1) per tick, matching
+    TickIndicators.calculate_tick_volatility on the same ticks. The window
+    is re-summed exactly every `resync_interval` ticks so rounding drift
+    from the add/remove updates cannot accumulate.
+    """
+
+    __slots__ = ('capacity', 'resync_interval', 'diffs', 'count', 'mean', 'm2', 'prev_price')
+
+    def __init__(self, window_ticks: int, resync_interval: int = 1000):
+        self.capacity = window_ticks - 1  # diffs between window_ticks prices
+        self.resync_interval = resync_interval
+        self.diffs = [0.0] * self.capacity
+        self.count = 0  # diffs seen so far
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.prev_price = None
+
+    def update(self, price: float):
+        """Add a tick price"""
+        prev_price = self.prev_price
+        self.prev_price = price
+        if prev_price is None:
+            return
+
+        x = abs(price - prev_price)
+        k = self.count % self.capacity
+        self.count += 1
+        if self.count <= self.capacity:
+            # Window still filling: plain Welford
+            delta = x - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (x - self.mean)
+        else:
+            # Full window: replace the oldest diff
+            y = self.diffs[k]
+            old_mean = self.mean
+            self.mean += (x - y) / self.capacity
+            self.m2 += (x - y) * (x - self.mean + y - old_mean)
+        self.diffs[k] = x
+
+        if self.count % self.resync_interval == 0:
+            n = min(self.count, self.capacity)
+            window = self.diffs[:n]
+            self.mean = sum(window) / n
+            self.m2 = sum((d - self.mean) ** 2 for d in window)
+
+    def std(self) -> float:
+        """Population std of the window (0.0 before two ticks)"""
+        n = min(self.count, self.capacity)
+        if n == 0:
+            return 0.0
+        return max(self.m2, 0.0) ** 0.5 / n ** 0.5
+
+
+class PositionTable:
+    """Open positions as one NumPy array per field
+
+    Two-way entry holds at most one LONG + one SHORT per symbol, so every
+    position has a fixed slot: 2 * symbol_id for LONG, +1 for SHORT. Slots
+    are flagged active/inactive instead of being allocated and freed.
+    """
+
+    __slots__ = (
+        'active', 'symbol_id', 'sign', 'pos_id', 'entry_price', 'size',
+        'entry_ns', 'peak', 'stop_price', 'open_by_symbol', 'open_count'
+    )
+
+    def __init__(self, num_symbols: int):
+        num_slots = 2 * num_symbols
+        self.active = np.zeros(num_slots, dtype=bool)
+        self.symbol_id = np.repeat(np.arange(num_symbols, dtype=np.int32), 2)
+        self.sign = np.tile([1.0, -1.0], num_symbols)  # +1 LONG, -1 SHORT
+        self.pos_id = np.zeros(num_slots, dtype=np.int64)
+        self.entry_price = np.zeros(num_slots, dtype=np.float64)
+        self.size = np.zeros(num_slots, dtype=np.float64)
+        self.entry_ns = np.zeros(num_slots, dtype=np.int64)
+        self.peak = np.zeros(num_slots, dtype=np.float64)  # best price since entry
+        self.stop_price = np.zeros(num_slots, dtype=np.float64)
+        # Plain-int counts so per-tick "any open?" checks skip NumPy scalars
+        self.open_by_symbol = [0] * num_symbols
+        self.open_count = 0
+
+    def __len__(self) -> int:
+        return self.open_count
+
+    def open_pair(self, symbol_id: int, pos_id: int, price: float, size: float, ts_ns: int):
+        """Fill a symbol's LONG and SHORT slots (ids pos_id, pos_id + 1)"""
+        slots = slice(2 * symbol_id, 2 * symbol_id + 2)
+        self.active[slots] = True
+        self.pos_id[slots] = [pos_id, pos_id + 1]
+        self.entry_price[slots] = price
+        self.size[slots] = size
+        self.entry_ns[slots] = ts_ns
+        # Trailing stop state starts at the entry price (peak = entry)
+        self.peak[slots] = price
+        self.stop_price[slots] = price
+        self.open_by_symbol[symbol_id] += 2
+        self.open_count += 2
+
+    def release(self, slot: int):
+        """Mark a slot closed"""
+        self.active[slot] = False
+        self.open_by_symbol[slot >> 1] -= 1
+        self.open_count -= 1
+
+
 class TickBacktester:
     """Tick-by-tick backtesting engine
 
@@ -35,6 +283,19 @@ class TickBacktester:
     NO candle assumptions - pure tick-based simulation.
     """
 
+    # Fixed attribute layout: hot-path attribute loads skip the instance
+    # __dict__ (subclasses that add attributes still get one)
+    __slots__ = (
+        'symbols', 'initial_balance', 'balance', 'leverage', 'position_size_pct',
+        'taker_fee', 'slippage_pct',
+        '_symbol_ids', 'buf', 'head', 'tick_counts', '_last_price', '_now_ns',
+        '_stop_volatility', '_signal_indicators', '_tick_processor',
+        'positions', 'orders', '_trades', '_trade_n', '_reasons', '_reason_ids', '_next_pos_id',
+        'total_fees_paid',
+        '_eq_cap', '_eq_n', '_eq_ts', '_eq_bal', '_eq_upnl', '_eq_tot', '_eq_npos',
+        'tick_indicators', 'trailing_stop_manager'
+    )
+
     def __init__(
         self,
         symbols: List[str],
@@ -62,21 +323,57 @@ class TickBacktester:
         self.taker_fee = taker_fee
         self.slippage_pct = slippage_pct
 
-        # Tick data storage
-        self.tick_buffers: Dict[str, List[Tick]] = {symbol: [] for symbol in symbols}
+        # Tick data storage (last 10,000 ticks = ~16 minutes at 10 ticks/sec):
+        # fixed-size SoA ring buffer per symbol, written at self.head[symbol_id].
+        # Per-symbol state is indexed by integer symbol id (position in
+        # self.symbols); only _symbol_ids maps names to ids.
+        self._symbol_ids: Dict[str, int] = {symbol: i for i, symbol in enumerate(symbols)}
+        self.buf: List[Dict[str, np.ndarray]] = [
+            {
+                name: np.empty(TICK_BUFFER_SIZE, dtype=dtype)
+                for name, dtype in TICK_COLUMNS.items()
+            }
+            for _ in symbols
+        ]
+        self.head: List[int] = [0] * len(symbols)
+        self.tick_counts: List[int] = [0] * len(symbols)
+        self._last_price = np.zeros(len(symbols), np.float64)
+        # Simulated clock: timestamp (int64 ns) of the tick being processed
+        self._now_ns = 0
+        # Per-symbol signal indicators computed ahead of the tick loop
+        # (run_backtest with indicator_workers); None = compute inline
+        self._signal_indicators: Optional[List[List[dict]]] = None
+        # Trailing stop volatility, updated incrementally on every tick
+        self._stop_volatility = [
+            RollingTickVolatility(STOP_VOLATILITY_TICKS) for _ in symbols
+        ]
+        # Per-tick closure, built on first use by process_tick
+        self._tick_processor = None
 
         # Trading state
-        self.positions: Dict[str, dict] = {}
+        self.positions = PositionTable(len(symbols))
         self.orders: List[dict] = []
-        self.trades: List[dict] = []
+        # Closed trades: preallocated structured array, doubled when full
+        self._trades = np.empty(1024, dtype=TRADE_DTYPE)
+        self._trade_n = 0
+        self._reasons: List[str] = []
+        self._reason_ids: Dict[str, int] = {}
+        # Position ids are a plain counter: timestamp-based keys collide when
+        # two entries land on the same microsecond and silently overwrite.
+        self._next_pos_id = 0
 
         # Fee tracking
         self.total_fees_paid = 0.0
 
-        # Performance tracking
-        self.equity_curve: List[dict] = []
-        self.max_balance = initial_balance
-        self.min_balance = initial_balance
+        # Performance tracking: equity curve streamed into preallocated
+        # column buffers (doubled when full) instead of a list of dicts
+        self._eq_cap = 1024
+        self._eq_n = 0
+        self._eq_ts = np.empty(self._eq_cap, np.int64)
+        self._eq_bal = np.empty(self._eq_cap, np.float64)
+        self._eq_upnl = np.empty(self._eq_cap, np.float64)
+        self._eq_tot = np.empty(self._eq_cap, np.float64)
+        self._eq_npos = np.empty(self._eq_cap, np.int32)
 
         # Components
         self.tick_indicators = TickIndicators()
@@ -106,28 +403,32 @@ class TickBacktester:
         Returns:
             List of Tick objects
         """
-        ticks = []
-
         try:
-            with open(file_path, 'r') as f:
-                for i, line in enumerate(f):
-                    if limit and i >= limit:
-                        break
-
-                    data = json.loads(line)
-                    tick = Tick(
-                        symbol=data['symbol'],
-                        timestamp=datetime.fromisoformat(data['timestamp']),
-                        price=float(data['price']),
-                        bid=float(data['bid']),
-                        ask=float(data['ask']),
-                        bid_qty=float(data.get('bid_qty', 0)),
-                        ask_qty=float(data.get('ask_qty', 0)),
-                        volume_24h=float(data['volume_24h']),
-                        quote_volume_24h=float(data.get('quote_volume_24h', 0)),
-                        price_change_pct=float(data.get('price_change_pct', 0))
-                    )
-                    ticks.append(tick)
+            with open(file_path, 'rb') as f:
+                records = [orjson.loads(line) for line in islice(f, limit or None)]
+
+            # Parse all timestamps in one vectorized call instead of
+            # datetime.fromisoformat per line
+            timestamps = pd.to_datetime(
+                [data['timestamp'] for data in records],
+                format='ISO8601'
+            ).to_pydatetime()
+
+            ticks = [
+                Tick(
+                    symbol=data['symbol'],
+                    timestamp=timestamp,
+                    price=float(data['price']),
+                    bid=float(data['bid']),
+                    ask=float(data['ask']),
+                    bid_qty=float(data.get('bid_qty', 0)),
+                    ask_qty=float(data.get('ask_qty', 0)),
+                    volume_24h=float(data['volume_24h']),
+                    quote_volume_24h=float(data.get('quote_volume_24h', 0)),
+                    price_change_pct=float(data.get('price_change_pct', 0))
+                )
+                for data, timestamp in zip(records, timestamps)
+            ]
 
             logger.info(f"✅ Loaded {len(ticks):,} ticks from {file_path.name}")
             return ticks
@@ -136,6 +437,132 @@ class TickBacktester:
             logger.error(f"❌ Error loading tick data: {e}")
             return []
 
+    async def load_tick_arrays_from_file(
+        self,
+        symbol: str,
+        file_path: Path,
+        limit: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """Load historical tick data from file as column arrays
+
+        Same input as load_tick_data_from_file, but no Tick objects are built:
+        values go straight into NumPy columns. The file is parsed by the
+        pyarrow JSON reader when pyarrow is installed, otherwise line by line
+        with orjson into preallocated columns. Parquet files written by
+        TickDataCollector(save_to_disk_format='parquet') are read directly
+        (requires pyarrow). The result can be passed to run_backtest in place
+        of a tick list.
+
+        Args:
+            symbol: Trading symbol
+            file_path: Path to tick data file
+            limit: Max ticks to load (None = all)
+
+        Returns:
+            Dictionary of TICK_COLUMNS arrays (ts as int64 nanoseconds)
+        """
+        try:
+            if file_path.suffix == '.parquet':
+                timestamps, price, volume, bid, ask = self._read_tick_columns_parquet(file_path, limit)
+            elif pa_json is not None:
+                timestamps, price, volume, bid, ask = self._read_tick_columns_arrow(file_path, limit)
+            else:
+                timestamps, price, volume, bid, ask = self._read_tick_columns_orjson(file_path, limit)
+
+            ts = pd.to_datetime(timestamps, format='ISO8601', cache=True)
+            columns = {
+                'ts': ts.values.astype('datetime64[ns]').astype(np.int64),
+                'price': price,
+                'volume': volume,
+                'bid': bid,
+                'ask': ask
+            }
+
+            logger.info(f"✅ Loaded {len(price):,} ticks from {file_path.name}")
+            return columns
+
+        except Exception as e:
+            logger.error(f"❌ Error loading tick data: {e}")
+            return {name: np.empty(0, dtype) for name, dtype in TICK_COLUMNS.items()}
+
+    @staticmethod
+    def _read_tick_columns_arrow(file_path: Path, limit: Optional[int]):
+        """Parse a tick JSONL file with the pyarrow (C++) JSON reader"""
+        schema = pa.schema([
+            ('timestamp', pa.string()),
+            ('price', pa.float64()),
+            ('volume_24h', pa.float64()),
+            ('bid', pa.float64()),
+            ('ask', pa.float64())
+        ])
+        if limit:
+            # Hand the reader only the first `limit` lines so a limited
+            # load doesn't read and parse the whole file
+            with open(file_path, 'rb') as f:
+                source = pa.BufferReader(b''.join(islice(f, limit)))
+        else:
+            source = str(file_path)
+        table = pa_json.read_json(
+            source,
+            read_options=pa_json.ReadOptions(block_size=LOADER_BUFFER_BYTES),
+            parse_options=pa_json.ParseOptions(
+                explicit_schema=schema,
+                unexpected_field_behavior='ignore'
+            )
+        )
+        return (
+            table.column('timestamp').to_numpy(),
+            table.column('price').to_numpy(),
+            table.column('volume_24h').to_numpy(),
+            table.column('bid').to_numpy(),
+            table.column('ask').to_numpy()
+        )
+
+    @staticmethod
+    def _read_tick_columns_parquet(file_path: Path, limit: Optional[int]):
+        """Read the tick columns of a Parquet tick file"""
+        if pq is None:
+            raise ImportError("pyarrow is required to read Parquet tick files")
+        table = pq.read_table(file_path, columns=['timestamp', 'price', 'volume_24h', 'bid', 'ask'])
+        if limit:
+            table = table.slice(0, limit)
+        return (
+            table.column('timestamp').to_numpy(),
+            table.column('price').to_numpy(),
+            table.column('volume_24h').to_numpy(),
+            table.column('bid').to_numpy(),
+            table.column('ask').to_numpy()
+        )
+
+    @staticmethod
+    def _read_tick_columns_orjson(file_path: Path, limit: Optional[int]):
+        """Parse a tick JSONL file line by line into preallocated columns"""
+        capacity = LOADER_CHUNK_ROWS
+        price = np.empty(capacity, np.float64)
+        volume = np.empty(capacity, np.float64)
+        bid = np.empty(capacity, np.float64)
+        ask = np.empty(capacity, np.float64)
+        timestamps = []
+        n = 0
+
+        with open(file_path, 'rb', buffering=LOADER_BUFFER_BYTES) as f:
+            for line in islice(f, limit or None):
+                data = orjson.loads(line)
+                if n == capacity:
+                    capacity += LOADER_CHUNK_ROWS
+                    price = _grow(price, capacity)
+                    volume = _grow(volume, capacity)
+                    bid = _grow(bid, capacity)
+                    ask = _grow(ask, capacity)
+                timestamps.append(data['timestamp'])
+                price[n] = data['price']
+                volume[n] = data['volume_24h']
+                bid[n] = data['bid']
+                ask[n] = data['ask']
+                n += 1
+
+        return timestamps, price[:n], volume[:n], bid[:n], ask[:n]
+
     async def load_tick_data_live(
         self,
         symbol: str,
@@ -176,114 +603,174 @@ class TickBacktester:
 
         return ticks
 
-    def process_tick(self, tick: Tick):
+    def process_tick(self, tick: Tick, ts_ns: Optional[int] = None):
         """Process a single tick (simulate real-time)
 
         This is the core backtesting function - processes each tick
         as if it just arrived via WebSocket.
-        """
-        symbol = tick.symbol
-
-        # Add to buffer
-        self.tick_buffers[symbol].append(tick)
 
-        # Keep last 10,000 ticks (~16 minutes at 10 ticks/sec)
-        if len(self.tick_buffers[symbol]) > 10000:
-            self.tick_buffers[symbol].pop(0)
-
-        # Check trailing stops
-        self._check_trailing_stops(symbol, tick.price, tick.timestamp)
+        Args:
+            tick: Incoming tick
+            ts_ns: Tick timestamp as int64 nanoseconds (computed from
+                tick.timestamp when not supplied)
+        """
+        if ts_ns is None:
+            ts_ns = _datetime_to_ns(tick.timestamp)
+        if self._tick_processor is None:
+            self._tick_processor = self._make_tick_processor()
+        self._tick_processor(
+            self._symbol_ids[tick.symbol], tick.price, ts_ns,
+            tick.volume_24h, tick.bid, tick.ask
+        )
 
-        # Generate signals (every 10 ticks = ~1 second)
-        tick_count = len(self.tick_buffers[symbol])
-        if tick_count >= 100 and tick_count % 10 == 0:
-            self._generate_and_execute_signals(symbol, tick)
+    def _make_tick_processor(self):
+        """Build process_tick on plain scalars as a closure
 
-        # Update equity curve (every 100 ticks = ~10 seconds)
-        if tick_count % 100 == 0:
-            self._record_equity(tick.timestamp)
+        Buffers, counters and bound methods are captured as free variables
+        so the per-tick path does local loads instead of self.* lookups.
+        Only long-lived objects are captured (the ring buffers and price
+        array are never reallocated); mutable scalars stay on self.
 
-    def _generate_and_execute_signals(self, symbol: str, tick: Tick):
+        Returns:
+            process(symbol_id, price, ts_ns, volume, bid, ask)
+        """
+        columns = [
+            (buf['ts'], buf['price'], buf['volume'], buf['bid'], buf['ask'])
+            for buf in self.buf
+        ]
+        heads = self.head
+        tick_counts = self.tick_counts
+        last_price = self._last_price
+        stop_volatility_updates = [rolling.update for rolling in self._stop_volatility]
+        check_trailing_stops = self._check_trailing_stops
+        generate_and_execute_signals = self._generate_and_execute_signals
+        record_equity = self._record_equity
+        buffer_size = TICK_BUFFER_SIZE
+        warmup = SIGNAL_WARMUP_TICKS
+        signal_interval = SIGNAL_INTERVAL_TICKS
+        equity_interval = EQUITY_INTERVAL_TICKS
+        backtester = self
+
+        def process(symbol_id, price, ts_ns, volume, bid, ask):
+            backtester._now_ns = ts_ns
+
+            # Add to ring buffer (overwrites the oldest tick once full)
+            ts_col, price_col, volume_col, bid_col, ask_col = columns[symbol_id]
+            head = heads[symbol_id]
+            ts_col[head] = ts_ns
+            price_col[head] = price
+            volume_col[head] = volume
+            bid_col[head] = bid
+            ask_col[head] = ask
+            heads[symbol_id] = (head + 1) % buffer_size
+            last_price[symbol_id] = price
+            tick_count = tick_counts[symbol_id] + 1
+            tick_counts[symbol_id] = tick_count
+            stop_volatility_updates[symbol_id](price)
+
+            # Check trailing stops
+            check_trailing_stops(symbol_id, price, ts_ns)
+
+            # Generate signals (every 10 ticks = ~1 second)
+            # Counted monotonically: the buffer length stops growing at capacity
+            if tick_count >= warmup and tick_count % signal_interval == 0:
+                generate_and_execute_signals(symbol_id, price, ts_ns)
+
+            # Update equity curve (every 100 ticks = ~10 seconds)
+            if tick_count % equity_interval == 0:
+                record_equity(ts_ns)
+
+        return process
+
+    def _recent_view(self, symbol_id: int, n: int, column: str) -> np.ndarray:
+        """Last n values of a ring buffer column, oldest first
+
+        A zero-copy slice unless the window wraps around the end of the
+        buffer, in which case the two pieces are concatenated.
+        """
+        n = min(n, self.tick_counts[symbol_id], TICK_BUFFER_SIZE)
+        head = self.head[symbol_id]
+        arr = self.buf[symbol_id][column]
+        start = head - n
+        if start >= 0:
+            return arr[start:head]
+        return np.concatenate((arr[start:], arr[:head]))
+
+    def _generate_and_execute_signals(self, symbol_id: int, price: float, ts_ns: int):
         """Generate trading signals from tick data"""
 
-        # Get recent ticks (last 1000 = ~100 seconds)
-        recent_ticks = self.tick_buffers[symbol][-1000:]
-
-        if len(recent_ticks) < 100:
+        # Get recent ticks (last 1000 = ~100 seconds) as ring buffer views
+        symbol = self.symbols[symbol_id]
+        tick_count = self.tick_counts[symbol_id]
+        if min(tick_count, SIGNAL_WINDOW_SIZE) < 100:
             return
 
-        # Calculate hybrid volatility (fixes the scale mismatch issue)
-        std_vol, atr_vol, hybrid_vol = self.tick_indicators.calculate_hybrid_volatility(
-            recent_ticks,
-            lookback_seconds=600  # 10 minutes
-        )
+        if self._signal_indicators is not None:
+            indicators = self._signal_indicators[symbol_id][
+                (tick_count - SIGNAL_WARMUP_TICKS) // SIGNAL_INTERVAL_TICKS
+            ]
+            self._act_on_signal(symbol, indicators, price, ts_ns)
+            return
 
-        # Calculate other tick indicators
-        indicators = self.tick_indicators.generate_tick_summary(
-            recent_ticks,
-            lookback_seconds=600
+        ts_ns_arr = self._recent_view(symbol_id, SIGNAL_WINDOW_SIZE, 'ts')
+        prices = self._recent_view(symbol_id, SIGNAL_WINDOW_SIZE, 'price')
+        volumes = self._recent_view(symbol_id, SIGNAL_WINDOW_SIZE, 'volume')
+        bids = self._recent_view(symbol_id, SIGNAL_WINDOW_SIZE, 'bid')
+        asks = self._recent_view(symbol_id, SIGNAL_WINDOW_SIZE, 'ask')
+
+        # Tick indicators + hybrid volatility (fixes the scale mismatch issue)
+        # in one fused pass over the 10 minute window
+        indicators = self.tick_indicators.compute_all(
+            prices,
+            ts_ns_arr,
+            volumes,
+            bids,
+            asks,
+            lookback_seconds=SIGNAL_LOOKBACK_SECONDS
         )
+        self._act_on_signal(symbol, indicators, price, ts_ns)
 
-        # Add hybrid volatility metrics to indicators
-        indicators['std_volatility'] = std_vol
-        indicators['atr_volatility'] = atr_vol
-        indicators['hybrid_volatility'] = hybrid_vol
-
-        # Generate signal
-        signal = self._get_tick_signal(symbol, indicators, tick.price)
+    def _act_on_signal(self, symbol: str, indicators: dict, price: float, ts_ns: int):
+        """Turn indicators into a signal and execute it"""
+        signal = self._get_tick_signal(symbol, indicators, price)
 
         if signal['action'] == 'BOTH':
-            self._execute_two_way_entry(symbol, tick.price, signal, tick.timestamp)
+            self._execute_two_way_entry(symbol, price, signal, ts_ns)
         elif signal['action'] == 'CLOSE':
-            self._close_all_positions(symbol, tick.price, tick.timestamp, signal['reason'])
+            self._close_all_positions(symbol, price, ts_ns, signal['reason'])
 
     def _get_tick_signal(self, symbol: str, indicators: dict, current_price: float) -> dict:
-        """Generate signal from tick indicators (using hybrid volatility)"""
+        """Generate signal from tick indicators (using hybrid volatility)
+
+        Two-way entry on SIGNIFICANT volatility + middle BB position; close on
+        volatility collapse or extreme BB. Thresholds live in _signal_kernel.
+        """
 
         # Use hybrid volatility which properly scales to tick data
         hybrid_vol = indicators.get('hybrid_volatility', 0)
         atr_vol = indicators.get('atr_volatility', 0)
-        std_vol = indicators.get('std_volatility', 0)
         bb = indicators.get('bollinger_bands', {})
         bb_position = bb.get('position', 0.5)
 
-        # Two-way entry: SIGNIFICANT volatility + middle BB position
-        # 목표: 승률 높이기 + 거래 줄이기 + 한 건당 수익 크게
-        #
-        # 조건 강화 (Fix: 임계값 로직 수정):
-        # 1. 하이브리드 변동성이 가격 대비 충분히 커야 함 (0.15% 이상)
-        #    - ETH @ $2,480: $0.372 이상 (기존 $0.48 hybrid 기준)
-        # 2. ATR 변동성이 가격 대비 의미있어야 함 (0.3% 이상)
-        #    - ETH @ $2,480: $7.44 이상 (median $7.40 기준)
-        # 3. Bollinger Band 중간 영역 (진입 안전 구간)
-        #
-        # 이전 문제: atr_vol >= atr_vol * 0.3 (항상 true)
-        # 수정: 가격 대비 절대 % 임계값 사용
-
-        if atr_vol > 0 and hybrid_vol > 0:
-            # 가격 대비 % 기준 임계값 (Price-relative thresholds)
-            hybrid_pct = (hybrid_vol / current_price) * 100
-            atr_pct = (atr_vol / current_price) * 100
-
-            # ADJUSTED THRESHOLDS (based on actual tick data analysis):
-            # 하이브리드 변동성: 가격의 0.04% 이상 (median ~0.04% from debug)
-            # ATR 변동성: 가격의 0.15% 이상 (median ~0.18% from debug)
-            # 목적: 실제 시장 변동성에 맞춘 현실적인 임계값
-            if hybrid_pct >= 0.04 and atr_pct >= 0.15:
-                # Bollinger Band 중간 영역 (진입 안전 구간)
-                if 0.40 < bb_position < 0.60:  # 조금 여유있는 중간 영역
-                    return {
-                        'action': 'BOTH',
-                        'confidence': 0.80,
-                        'reason': f'Moderate volatility (H:{hybrid_pct:.2f}% A:{atr_pct:.2f}%) + BB center',
-                        'indicators': indicators
-                    }
-
-        # Close positions: low volatility OR extreme BB OR profit target
-        has_positions = any(p['symbol'] == symbol for p in self.positions.values())
-        if has_positions:
+        action, close_reason, hybrid_pct, atr_pct = signal_kernel(
+            float(hybrid_vol),
+            float(atr_vol),
+            float(bb_position),
+            float(current_price),
+            self._has_positions(symbol)
+        )
+
+        if action == BOTH:
+            return {
+                'action': 'BOTH',
+                'confidence': 0.80,
+                'reason': f'Moderate volatility (H:{hybrid_pct:.2f}% A:{atr_pct:.2f}%) + BB center',
+                'indicators': indicators
+            }
+
+        if action == CLOSE:
             # 1. 변동성 급락 (시장 안정화)
-            if hybrid_vol < atr_vol * 0.05:  # ATR의 5% 미만
+            if close_reason == CLOSE_VOL_COLLAPSE:
                 return {
                     'action': 'CLOSE',
                     'confidence': 0.85,
@@ -291,126 +778,146 @@ class TickBacktester:
                 }
 
             # 2. Bollinger Band 극단 (방향 전환 신호)
-            if bb_position < 0.15 or bb_position > 0.85:
-                return {
-                    'action': 'CLOSE',
-                    'confidence': 0.80,
-                    'reason': f'Extreme BB ({bb_position:.2%})'
-                }
+            return {
+                'action': 'CLOSE',
+                'confidence': 0.80,
+                'reason': f'Extreme BB ({bb_position:.2%})'
+            }
 
         return {'action': 'HOLD', 'confidence': 0.5, 'reason': 'No signal'}
 
+    def _has_positions(self, symbol: str) -> bool:
+        """Check whether a symbol has any open position (O(1))"""
+        return self.positions.open_by_symbol[self._symbol_ids[symbol]] > 0
+
     def _execute_two_way_entry(
         self,
         symbol: str,
         price: float,
         signal: dict,
-        timestamp: datetime
+        ts_ns: int
     ):
         """Execute two-way simultaneous entry"""
 
         # Check if already have positions
-        if any(p['symbol'] == symbol for p in self.positions.values()):
+        if self._has_positions(symbol):
             return
 
         # Calculate position size
         position_size_usd = self.balance * self.position_size_pct
         position_size = position_size_usd / price
 
-        # LONG position
-        long_key = f"{symbol}_LONG_{timestamp.timestamp()}"
-        self.positions[long_key] = {
-            'symbol': symbol,
-            'type': 'LONG',
-            'entry_price': price,
-            'size': position_size,
-            'entry_time': timestamp,
-            'confidence': signal['confidence']
-        }
-
-        # SHORT position
-        short_key = f"{symbol}_SHORT_{timestamp.timestamp()}"
-        self.positions[short_key] = {
-            'symbol': symbol,
-            'type': 'SHORT',
-            'entry_price': price,
-            'size': position_size,
-            'entry_time': timestamp,
-            'confidence': signal['confidence']
-        }
+        # LONG + SHORT positions
+        self.positions.open_pair(
+            self._symbol_ids[symbol], self._next_pos_id, price, position_size, ts_ns
+        )
+        self._next_pos_id += 2
 
-        # Initialize trailing stops FIRST (critical fix)
-        # Must call initialize_position() before update_trailing_stop()
-        self.trailing_stop_manager.initialize_position(long_key, price, 'LONG')
-        self.trailing_stop_manager.initialize_position(short_key, price, 'SHORT')
+        # Guarded: f-string arguments are built even when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            hybrid_vol = signal.get('indicators', {}).get('hybrid_volatility', price * 0.01)
+            logger.debug(f"🎯 TWO-WAY ENTRY: {symbol} @ ${price:.2f} | Vol: ${hybrid_vol:.4f}")
 
-        # Now update with hybrid volatility as ATR
-        hybrid_vol = signal.get('indicators', {}).get('hybrid_volatility', price * 0.01)
-        self.trailing_stop_manager.update_trailing_stop(long_key, price, hybrid_vol)
-        self.trailing_stop_manager.update_trailing_stop(short_key, price, hybrid_vol)
+    def _check_trailing_stops(self, symbol_id: int, current_price: float, ts_ns: int):
+        """Check trailing stops for all positions
 
-        logger.debug(f"🎯 TWO-WAY ENTRY: {symbol} @ ${price:.2f} | Vol: ${hybrid_vol:.4f}")
+        One compiled update_trailing_stops call over the symbol's LONG/SHORT
+        slots of the positions table. Same rules as TrailingStopManager.update_trailing_stop, whose
+        parameters are read from self.trailing_stop_manager so callers can
+        keep tuning them there.
+        """
+        positions = self.positions
+        if not positions.open_by_symbol[symbol_id]:
+            return
 
-    def _check_trailing_stops(self, symbol: str, current_price: float, timestamp: datetime):
-        """Check trailing stops for all positions"""
+        # Get volatility as ATR proxy (last 100 ticks)
+        if self.tick_counts[symbol_id] < 10:
+            return
 
-        positions_to_close = []
+        volatility = self._trailing_stop_volatility(symbol_id, ts_ns)
 
-        for position_key, position in self.positions.items():
-            if position['symbol'] != symbol:
-                continue
+        tsm = self.trailing_stop_manager
 
-            # Get volatility as ATR proxy
-            recent_ticks = self.tick_buffers[symbol][-100:]
-            if len(recent_ticks) < 10:
-                continue
+        # Dynamic ATR multiplier band (tightened with profit in the kernel)
+        volatility_pct = volatility / current_price
+        if volatility_pct > 0.03:
+            base_multiplier = 2.2
+        elif volatility_pct > 0.01:
+            base_multiplier = 1.8
+        else:
+            base_multiplier = 1.5
 
-            volatility = self.tick_indicators.calculate_tick_volatility(
-                recent_ticks,
-                lookback_seconds=60
-            )
+        # Hard stop distance (dynamic ATR-based or fixed)
+        if tsm.use_dynamic_hard_stop:
+            stop_distance = max(tsm.max_loss_pct, volatility_pct * tsm.hard_stop_atr_multiplier)
+        else:
+            stop_distance = tsm.max_loss_pct
+
+        slots = slice(2 * symbol_id, 2 * symbol_id + 2)  # [LONG, SHORT]
+        hit = update_trailing_stops(
+            current_price,
+            volatility,
+            base_multiplier,
+            stop_distance,
+            tsm.min_profit_threshold,
+            tsm.acceleration_step,
+            positions.active[slots],
+            positions.sign[slots],
+            positions.entry_price[slots],
+            positions.peak[slots],
+            positions.stop_price[slots]
+        )
 
-            # Check stop
-            stop_price, should_close = self.trailing_stop_manager.update_trailing_stop(
-                position_key,
-                current_price,
-                volatility
-            )
+        # Close positions (LONG slot first, matching entry order)
+        if hit.any():
+            self._close_positions(np.flatnonzero(hit) + 2 * symbol_id, current_price, "Trailing Stop", ts_ns)
 
-            if should_close:
-                positions_to_close.append(position_key)
+    def _trailing_stop_volatility(self, symbol_id: int, ts_ns: int) -> float:
+        """Tick volatility of the last 100 ticks within 60 seconds
 
-        # Close positions
-        for position_key in positions_to_close:
-            self._close_position(position_key, current_price, "Trailing Stop", timestamp)
+        Served from the rolling per-symbol window; only when the 100 ticks
+        span more than 60 seconds (a gap in the feed) is the shorter time
+        window recomputed from the ring buffer.
+        """
+        n = min(self.tick_counts[symbol_id], STOP_VOLATILITY_TICKS)
+        oldest_ns = self.buf[symbol_id]['ts'][(self.head[symbol_id] - n) % TICK_BUFFER_SIZE]
+        if oldest_ns >= ts_ns - STOP_VOLATILITY_LOOKBACK * 1_000_000_000:
+            return self._stop_volatility[symbol_id].std()
+
+        return self.tick_indicators.calculate_tick_volatility_arrays(
+            self._recent_view(symbol_id, STOP_VOLATILITY_TICKS, 'price'),
+            self._recent_view(symbol_id, STOP_VOLATILITY_TICKS, 'ts'),
+            lookback_seconds=STOP_VOLATILITY_LOOKBACK
+        )
 
-    def _close_position(
+    def _close_positions(
         self,
-        position_key: str,
+        slots: np.ndarray,
         exit_price: float,
         reason: str,
-        timestamp: datetime
+        ts_ns: int
     ):
-        """Close a position and record trade"""
+        """Close the positions in PositionTable slots and record trades
 
-        position = self.positions.get(position_key)
-        if not position:
+        P&L, fees and trade rows for all K positions are computed in one
+        vectorized pass; balances are accumulated in slot order so each
+        trade's balance_after matches closing them one at a time.
+        """
+        positions = self.positions
+        slots = slots[positions.active[slots]]
+        k = len(slots)
+        if k == 0:
             return
 
-        # Apply slippage (unfavorable execution)
-        entry_price = position['entry_price']
-        size = position['size']
-
-        if position['type'] == 'LONG':
-            # LONG: buy higher (entry), sell lower (exit)
-            entry_with_slippage = entry_price * (1 + self.slippage_pct)
-            exit_with_slippage = exit_price * (1 - self.slippage_pct)
-            pnl_gross = (exit_with_slippage - entry_with_slippage) * size * self.leverage
-        else:  # SHORT
-            # SHORT: sell lower (entry), buy higher (exit)
-            entry_with_slippage = entry_price * (1 - self.slippage_pct)
-            exit_with_slippage = exit_price * (1 + self.slippage_pct)
-            pnl_gross = (entry_with_slippage - exit_with_slippage) * size * self.leverage
+        entry_price = positions.entry_price[slots]
+        size = positions.size[slots]
+        sign = positions.sign[slots]
+
+        # Apply slippage (unfavorable execution): LONG buys higher and sells
+        # lower, SHORT sells lower and buys higher
+        entry_with_slippage = entry_price * (1 + sign * self.slippage_pct)
+        exit_with_slippage = exit_price * (1 - sign * self.slippage_pct)
+        pnl_gross = sign * (exit_with_slippage - entry_with_slippage) * size * self.leverage
 
         # Calculate fees (entry + exit)
         position_value = entry_price * size
@@ -422,96 +929,183 @@ class TickBacktester:
         pnl_net = pnl_gross - total_fee
         pnl_pct = (pnl_net / (entry_price * size * self.leverage)) * 100
 
-        # Update balance
-        self.balance += pnl_net
-        self.total_fees_paid += total_fee
-        self.max_balance = max(self.max_balance, self.balance)
-        self.min_balance = min(self.min_balance, self.balance)
-
-        # Record trade
-        trade = {
-            'position_key': position_key,
-            'symbol': position['symbol'],
-            'type': position['type'],
-            'entry_price': entry_price,
-            'exit_price': exit_price,
-            'size': size,
-            'pnl_gross': pnl_gross,
-            'fees': total_fee,
-            'pnl': pnl_net,
-            'pnl_pct': pnl_pct,
-            'entry_time': position['entry_time'].isoformat(),
-            'exit_time': timestamp.isoformat(),
-            'hold_time_seconds': (timestamp - position['entry_time']).total_seconds(),
-            'reason': reason,
-            'balance_after': self.balance
-        }
-        self.trades.append(trade)
-
-        # Remove position
-        del self.positions[position_key]
+        # Update balance (sequential running sums, one per closed trade)
+        balance_after = np.cumsum(np.concatenate(([self.balance], pnl_net)))[1:]
+        self.balance = float(balance_after[-1])
+        self.total_fees_paid = float(np.cumsum(np.concatenate(([self.total_fees_paid], total_fee)))[-1])
+
+        # Record trades (K rows; dicts are only built in _calculate_results)
+        n = self._trade_n
+        if n + k > len(self._trades):
+            self._trades = _grow(self._trades, max(2 * len(self._trades), n + k))
+        rows = self._trades[n:n + k]
+        rows['position_key'] = positions.pos_id[slots]
+        rows['symbol_id'] = slots >> 1
+        rows['is_long'] = sign > 0
+        rows['entry_price'] = entry_price
+        rows['exit_price'] = exit_price
+        rows['size'] = size
+        rows['pnl_gross'] = pnl_gross
+        rows['fees'] = total_fee
+        rows['pnl'] = pnl_net
+        rows['pnl_pct'] = pnl_pct
+        rows['entry_ns'] = positions.entry_ns[slots]
+        rows['exit_ns'] = ts_ns
+        rows['reason_id'] = self._reason_id(reason)
+        rows['balance_after'] = balance_after
+        self._trade_n = n + k
+
+        # Remove positions
+        for slot in slots.tolist():
+            positions.release(slot)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for position_key, pnl, pct, fee in zip(
+                rows['position_key'].tolist(), pnl_net.tolist(), pnl_pct.tolist(), total_fee.tolist()
+            ):
+                logger.debug(
+                    f"{'✅' if pnl > 0 else '❌'} CLOSE: {position_key} | "
+                    f"P&L: ${pnl:+.2f} ({pct:+.2f}%) | Fee: ${fee:.2f} | {reason}"
+                )
 
-        logger.debug(
-            f"{'✅' if pnl_net > 0 else '❌'} CLOSE: {position_key} | "
-            f"P&L: ${pnl_net:+.2f} ({pnl_pct:+.2f}%) | Fee: ${total_fee:.2f} | {reason}"
-        )
+    def _reason_id(self, reason: str) -> int:
+        """Intern a close reason string"""
+        reason_id = self._reason_ids.get(reason)
+        if reason_id is None:
+            reason_id = self._reason_ids[reason] = len(self._reasons)
+            self._reasons.append(reason)
+        return reason_id
+
+    def _trade_records(self) -> List[dict]:
+        """Materialize the trades table as a list of dicts for output"""
+        trades = self._trades[:self._trade_n]
+        # Timestamps stay int64 ns during the run; format them once here
+        entry_ns = trades['entry_ns']
+        exit_ns = trades['exit_ns']
+        hold_time = ((exit_ns - entry_ns) / 1e9).tolist()
+        return [
+            {
+                # Positions are keyed by an int id during the run; output
+                # keeps the "SYMBOL_SIDE_<entry epoch seconds>" key format
+                'position_key': (
+                    f"{self.symbols[symbol_id]}_{'LONG' if is_long else 'SHORT'}_"
+                    f"{datetime.fromisoformat(entry_time).timestamp()}"
+                ),
+                'symbol': self.symbols[symbol_id],
+                'type': 'LONG' if is_long else 'SHORT',
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'size': size,
+                'pnl_gross': pnl_gross,
+                'fees': fees,
+                'pnl': pnl,
+                'pnl_pct': pnl_pct,
+                'entry_time': entry_time,
+                'exit_time': exit_time,
+                'hold_time_seconds': hold_time_seconds,
+                'reason': self._reasons[reason_id],
+                'balance_after': balance_after
+            }
+            for (symbol_id, is_long, entry_price, exit_price, size,
+                 pnl_gross, fees, pnl, pnl_pct, entry_time, exit_time,
+                 hold_time_seconds, reason_id, balance_after) in zip(
+                trades['symbol_id'].tolist(),
+                trades['is_long'].tolist(),
+                trades['entry_price'].tolist(),
+                trades['exit_price'].tolist(),
+                trades['size'].tolist(),
+                trades['pnl_gross'].tolist(),
+                trades['fees'].tolist(),
+                trades['pnl'].tolist(),
+                trades['pnl_pct'].tolist(),
+                _ns_to_iso(entry_ns),
+                _ns_to_iso(exit_ns),
+                hold_time,
+                trades['reason_id'].tolist(),
+                trades['balance_after'].tolist()
+            )
+        ]
 
     def _close_all_positions(
         self,
         symbol: str,
         price: float,
-        timestamp: datetime,
+        ts_ns: int,
         reason: str
     ):
         """Close all positions for a symbol"""
 
-        positions_to_close = [
-            key for key, pos in self.positions.items()
-            if pos['symbol'] == symbol
-        ]
+        symbol_id = self._symbol_ids[symbol]
+        self._close_positions(np.arange(2 * symbol_id, 2 * symbol_id + 2), price, reason, ts_ns)
 
-        for position_key in positions_to_close:
-            self._close_position(position_key, price, reason, timestamp)
-
-    def _record_equity(self, timestamp: datetime):
+    def _record_equity(self, ts_ns: int):
         """Record current equity for curve"""
 
-        # Calculate unrealized P&L from open positions
-        unrealized_pnl = 0
-        for position_key, position in self.positions.items():
-            symbol = position['symbol']
-            if symbol not in self.tick_buffers or not self.tick_buffers[symbol]:
-                continue
-
-            current_price = self.tick_buffers[symbol][-1].price
-            entry_price = position['entry_price']
-            size = position['size']
-
-            if position['type'] == 'LONG':
-                unrealized_pnl += (current_price - entry_price) * size * self.leverage
-            else:
-                unrealized_pnl += (entry_price - current_price) * size * self.leverage
+        # Calculate unrealized P&L from open positions (one vectorized pass)
+        positions = self.positions
+        current_prices = self._last_price[positions.symbol_id]
+        unrealized_pnl = float(np.sum(
+            positions.active * positions.sign * (current_prices - positions.entry_price) * positions.size
+        )) * self.leverage
 
         total_equity = self.balance + unrealized_pnl
 
-        self.equity_curve.append({
-            'timestamp': timestamp.isoformat(),
-            'balance': self.balance,
-            'unrealized_pnl': unrealized_pnl,
-            'total_equity': total_equity,
-            'num_positions': len(self.positions)
-        })
+        if self._eq_n == self._eq_cap:
+            self._grow_equity_buffers()
+
+        n = self._eq_n
+        self._eq_ts[n] = ts_ns
+        self._eq_bal[n] = self.balance
+        self._eq_upnl[n] = unrealized_pnl
+        self._eq_tot[n] = total_equity
+        self._eq_npos[n] = len(self.positions)
+        self._eq_n = n + 1
+
+    def _grow_equity_buffers(self):
+        """Double the capacity of the equity curve buffers"""
+        self._eq_cap *= 2
+        self._eq_ts = _grow(self._eq_ts, self._eq_cap)
+        self._eq_bal = _grow(self._eq_bal, self._eq_cap)
+        self._eq_upnl = _grow(self._eq_upnl, self._eq_cap)
+        self._eq_tot = _grow(self._eq_tot, self._eq_cap)
+        self._eq_npos = _grow(self._eq_npos, self._eq_cap)
+
+    def _equity_curve_records(self) -> List[dict]:
+        """Materialize the equity curve buffers as a list of dicts for output"""
+        n = self._eq_n
+        return [
+            {
+                'timestamp': timestamp,
+                'balance': balance,
+                'unrealized_pnl': unrealized_pnl,
+                'total_equity': total_equity,
+                'num_positions': num_positions
+            }
+            for timestamp, balance, unrealized_pnl, total_equity, num_positions in zip(
+                _ns_to_iso(self._eq_ts[:n]),
+                self._eq_bal[:n].tolist(),
+                self._eq_upnl[:n].tolist(),
+                self._eq_tot[:n].tolist(),
+                self._eq_npos[:n].tolist()
+            )
+        ]
 
     async def run_backtest(
         self,
-        tick_data: Dict[str, List[Tick]],
-        progress_interval: int = 10000
+        tick_data: Dict[str, Union[List[Tick], Dict[str, np.ndarray]]],
+        progress_interval: int = 10000,
+        indicator_workers: int = 0
     ) -> dict:
         """Run tick-by-tick backtest
 
         Args:
-            tick_data: Dictionary of {symbol: [ticks]}
+            tick_data: Dictionary of {symbol: [ticks]}; a symbol's ticks may
+                also be given as column arrays from load_tick_arrays_from_file
             progress_interval: Log progress every N ticks
+            indicator_workers: If > 0, compute every symbol's signal
+                indicators up front in this many worker processes (one task
+                per symbol). Results are identical; the sequential loop then
+                only runs stops, signals and order execution.
 
         Returns:
             Backtest results dictionary
@@ -520,49 +1114,94 @@ class TickBacktester:
         logger.info("🚀 STARTING TICK-BY-TICK BACKTEST")
         logger.info("="*80)
 
-        # Get all ticks sorted by timestamp
-        all_ticks = []
-        for symbol, ticks in tick_data.items():
-            all_ticks.extend(ticks)
-
-        all_ticks.sort(key=lambda t: t.timestamp)
-
-        total_ticks = len(all_ticks)
+        # Flatten all symbols into parallel column arrays and order them by
+        # timestamp with a native argsort (no per-tick Python objects or key
+        # callbacks in the dispatch loop)
+        columns = self._flatten_tick_data(tick_data)
+        order = np.argsort(columns['ts'], kind='stable')
+        columns = {name: col[order] for name, col in columns.items()}
+        ts_ns = columns['ts']
+
+        total_ticks = len(ts_ns)
+        first_time = _ns_to_datetime(ts_ns[0])
+        last_time = _ns_to_datetime(ts_ns[-1])
         logger.info(f"Total ticks: {total_ticks:,}")
-        logger.info(f"Date range: {all_ticks[0].timestamp} → {all_ticks[-1].timestamp}")
-        logger.info(f"Duration: {all_ticks[-1].timestamp - all_ticks[0].timestamp}")
+        logger.info(f"Date range: {first_time} → {last_time}")
+        logger.info(f"Duration: {last_time - first_time}")
         logger.info("="*80 + "\n")
 
-        # Process each tick sequentially
-        start_time = datetime.now()
-
-        for i, tick in enumerate(all_ticks):
-            self.process_tick(tick)
+        if indicator_workers > 0:
+            await self._precompute_signal_indicators(columns, indicator_workers)
+
+        # Process ticks sequentially, dispatched in fixed-size batches so the
+        # inner loop stays tight and progress bookkeeping runs per batch
+        start_time = time.perf_counter()
+
+        # Quiet ticks (no open position on the symbol, not a signal tick)
+        # only feed the ring buffer and stop volatility, which nothing reads
+        # until the symbol's next signal tick. They are skipped here and
+        # written in bulk by _catch_up_symbol just before that tick runs.
+        symbol_columns = self._split_by_symbol(columns)
+        first_count = list(self.tick_counts)
+        seen = list(self.tick_counts)
+        tick_counts = self.tick_counts
+        open_by_symbol = self.positions.open_by_symbol
+        signal_interval = SIGNAL_INTERVAL_TICKS
+        catch_up = self._catch_up_symbol
+        process_tick = self._make_tick_processor()
+        next_progress = progress_interval
+
+        for batch_start in range(0, total_ticks, TICK_BATCH_SIZE):
+            batch = slice(batch_start, batch_start + TICK_BATCH_SIZE)
+            for args in zip(
+                columns['symbol_id'][batch].tolist(),
+                columns['price'][batch].tolist(),
+                ts_ns[batch].tolist(),
+                columns['volume'][batch].tolist(),
+                columns['bid'][batch].tolist(),
+                columns['ask'][batch].tolist()
+            ):
+                symbol_id = args[0]
+                count = seen[symbol_id] + 1
+                seen[symbol_id] = count
+                if count % signal_interval and not open_by_symbol[symbol_id]:
+                    continue
+                if tick_counts[symbol_id] != count - 1:
+                    catch_up(symbol_id, count - 1, symbol_columns, first_count)
+                process_tick(*args)
 
             # Progress logging
-            if (i + 1) % progress_interval == 0:
-                pct = ((i + 1) / total_ticks) * 100
+            processed = min(batch_start + TICK_BATCH_SIZE, total_ticks)
+            if processed >= next_progress:
+                pct = (processed / total_ticks) * 100
                 logger.info(
-                    f"Progress: {i+1:,}/{total_ticks:,} ticks ({pct:.1f}%) | "
+                    f"Progress: {processed:,}/{total_ticks:,} ticks ({pct:.1f}%) | "
                     f"Balance: ${self.balance:,.2f} | "
-                    f"Trades: {len(self.trades)} | "
+                    f"Trades: {self._trade_n} | "
                     f"Open: {len(self.positions)}"
                 )
+                next_progress = (processed // progress_interval + 1) * progress_interval
+
+        for symbol_id, count in enumerate(seen):
+            if tick_counts[symbol_id] != count:
+                catch_up(symbol_id, count, symbol_columns, first_count)
 
         # Close any remaining positions
-        final_tick = all_ticks[-1]
-        for symbol in self.symbols:
-            if symbol in self.tick_buffers and self.tick_buffers[symbol]:
-                final_price = self.tick_buffers[symbol][-1].price
+        final_ns = int(ts_ns[-1])
+        for symbol_id, symbol in enumerate(self.symbols):
+            if self.tick_counts[symbol_id]:
+                final_price = float(self._last_price[symbol_id])
                 self._close_all_positions(
                     symbol,
                     final_price,
-                    final_tick.timestamp,
+                    final_ns,
                     "Backtest End"
                 )
 
+        self._signal_indicators = None
+
         # Calculate results
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = time.perf_counter() - start_time
         results = self._calculate_results(elapsed, total_ticks)
 
         logger.info("\n" + "="*80)
@@ -578,6 +1217,195 @@ class TickBacktester:
 
         return results
 
+    def _split_by_symbol(self, columns: Dict[str, np.ndarray]) -> List[Dict[str, np.ndarray]]:
+        """Per-symbol TICK_COLUMNS arrays from the time-sorted flat columns"""
+        symbol_ids = columns['symbol_id']
+        split = []
+        for symbol_id in range(len(self.symbols)):
+            mask = symbol_ids == symbol_id
+            split.append({name: columns[name][mask] for name in TICK_COLUMNS})
+        return split
+
+    def _catch_up_symbol(
+        self,
+        symbol_id: int,
+        count: int,
+        symbol_columns: List[Dict[str, np.ndarray]],
+        first_count: List[int]
+    ):
+        """Apply a symbol's skipped ticks so its tick count reaches `count`
+
+        Writes them to the ring buffer with slice copies and feeds their
+        prices to the rolling stop volatility, leaving the same state as
+        processing them one at a time (they cannot touch positions).
+        """
+        start = self.tick_counts[symbol_id] - first_count[symbol_id]
+        end = count - first_count[symbol_id]
+        n = end - start
+        buf = self.buf[symbol_id]
+        head = self.head[symbol_id]
+        first = min(n, TICK_BUFFER_SIZE - head)
+        for name, column in symbol_columns[symbol_id].items():
+            values = column[start:end]
+            buf[name][head:head + first] = values[:first]
+            buf[name][:n - first] = values[first:]
+        self.head[symbol_id] = (head + n) % TICK_BUFFER_SIZE
+
+        prices = symbol_columns[symbol_id]['price'][start:end]
+        self._last_price[symbol_id] = prices[-1]
+        self.tick_counts[symbol_id] = count
+        update = self._stop_volatility[symbol_id].update
+        for price in prices.tolist():
+            update(price)
+
+    async def _precompute_signal_indicators(self, columns: Dict[str, np.ndarray], max_workers: int):
+        """Fill self._signal_indicators, one worker task per symbol"""
+        symbol_ids = columns['symbol_id']
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(self.symbols))) as executor:
+            tasks = []
+            for symbol_id in range(len(self.symbols)):
+                mask = symbol_ids == symbol_id
+                tasks.append(loop.run_in_executor(
+                    executor,
+                    _symbol_signal_indicators,
+                    type(self.tick_indicators),
+                    columns['ts'][mask],
+                    columns['price'][mask],
+                    columns['volume'][mask],
+                    columns['bid'][mask],
+                    columns['ask'][mask]
+                ))
+            self._signal_indicators = await asyncio.gather(*tasks)
+
+    async def run_split_capital_backtest(
+        self,
+        tick_data: Dict[str, Union[List[Tick], Dict[str, np.ndarray]]]
+    ) -> dict:
+        """Backtest each symbol as its own account, one process per symbol
+
+        This is a different model from run_backtest, not a faster version
+        of it. run_backtest trades every symbol from one shared balance, so
+        each symbol's position sizing and compounding depend on the others'
+        P&L. Here each symbol gets a fixed initial_balance / num_symbols
+        and never sees the other accounts. Balances, trade counts and the
+        equity curve are therefore NOT comparable with run_backtest. The
+        results carry mode='split_capital' to make that explicit.
+
+        Args:
+            tick_data: Dictionary of {symbol: [ticks]} (or column arrays)
+
+        Returns:
+            Backtest results dictionary (run_backtest keys plus 'mode')
+        """
+        symbols = [symbol for symbol in self.symbols if symbol in tick_data and _num_ticks(tick_data[symbol])]
+        if not symbols:
+            results = self._calculate_results(0.0, 0)
+            results['mode'] = 'split_capital'
+            return results
+
+        leg_balance = self.initial_balance / len(symbols)
+        config = {
+            'initial_balance': leg_balance,
+            'leverage': self.leverage,
+            'position_size_pct': self.position_size_pct,
+            'taker_fee': self.taker_fee,
+            'slippage_pct': self.slippage_pct
+        }
+        total_ticks = sum(_num_ticks(tick_data[symbol]) for symbol in symbols)
+
+        logger.info("🚀 SPLIT-CAPITAL BACKTEST: %d symbols × $%.2f each", len(symbols), leg_balance)
+        start_time = time.perf_counter()
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=len(symbols)) as executor:
+            legs = await asyncio.gather(*[
+                loop.run_in_executor(
+                    executor, _run_symbol_leg, type(self), symbol, tick_data[symbol], config
+                )
+                for symbol in symbols
+            ])
+
+        self._merge_legs(symbols, legs, leg_balance)
+
+        elapsed = time.perf_counter() - start_time
+        results = self._calculate_results(elapsed, total_ticks)
+        results['mode'] = 'split_capital'
+        return results
+
+    def _merge_legs(self, symbols: List[str], legs: List[dict], leg_balance: float):
+        """Re-sum per-symbol leg state into this backtester"""
+        self.balance = sum(leg['balance'] for leg in legs)
+        self.total_fees_paid = sum(leg['total_fees_paid'] for leg in legs)
+
+        # Trades in exit order, with symbol/reason ids mapped onto this
+        # backtester and balance_after rebased on the combined account
+        for symbol, leg in zip(symbols, legs):
+            leg_trades = leg['trades']
+            leg_trades['symbol_id'] = self._symbol_ids[symbol]
+            if len(leg_trades):
+                reason_map = np.array([self._reason_id(r) for r in leg['reasons']], dtype=np.int32)
+                leg_trades['reason_id'] = reason_map[leg_trades['reason_id']]
+        trades = np.concatenate([leg['trades'] for leg in legs])
+        trades = trades[np.argsort(trades['exit_ns'], kind='stable')]
+        trades['balance_after'] = self.initial_balance + np.cumsum(trades['pnl'])
+        self._trades = trades
+        self._trade_n = len(trades)
+
+        # Equity curve: at every leg sample time, sum each leg's latest sample
+        # (a leg with no sample yet contributes its untouched starting balance)
+        eq_ts = np.unique(np.concatenate([leg['eq_ts'] for leg in legs]))
+        n = len(eq_ts)
+        eq_bal = np.zeros(n)
+        eq_upnl = np.zeros(n)
+        eq_npos = np.zeros(n, np.int32)
+        for leg in legs:
+            idx = np.searchsorted(leg['eq_ts'], eq_ts, side='right') - 1
+            started = idx >= 0
+            idx = np.maximum(idx, 0)
+            if len(leg['eq_ts']):
+                eq_bal += np.where(started, leg['eq_bal'][idx], leg_balance)
+                eq_upnl += np.where(started, leg['eq_upnl'][idx], 0.0)
+                eq_npos += np.where(started, leg['eq_npos'][idx], 0).astype(np.int32)
+            else:
+                eq_bal += leg_balance
+
+        self._eq_cap = max(n, 1)
+        self._eq_n = n
+        self._eq_ts = eq_ts
+        self._eq_bal = eq_bal
+        self._eq_upnl = eq_upnl
+        self._eq_tot = eq_bal + eq_upnl
+        self._eq_npos = eq_npos
+
+    def _flatten_tick_data(self, tick_data: dict) -> Dict[str, np.ndarray]:
+        """Concatenate {symbol: ticks} into flat column arrays (unsorted)"""
+        symbol_ids, ts, price, volume, bid, ask = [], [], [], [], [], []
+        for symbol, ticks in tick_data.items():
+            n = _num_ticks(ticks)
+            symbol_ids.append(np.full(n, self._symbol_ids[symbol], dtype=np.int32))
+            if isinstance(ticks, dict):
+                # Already columnar (load_tick_arrays_from_file)
+                ts.append(np.asarray(ticks['ts'], dtype=np.int64))
+                price.append(np.asarray(ticks['price'], dtype=np.float64))
+                volume.append(np.asarray(ticks['volume'], dtype=np.float64))
+                bid.append(np.asarray(ticks['bid'], dtype=np.float64))
+                ask.append(np.asarray(ticks['ask'], dtype=np.float64))
+                continue
+            ts.append(_datetimes_to_ns([t.timestamp for t in ticks]))
+            price.append(np.fromiter((t.price for t in ticks), dtype=np.float64, count=n))
+            volume.append(np.fromiter((t.volume_24h for t in ticks), dtype=np.float64, count=n))
+            bid.append(np.fromiter((t.bid for t in ticks), dtype=np.float64, count=n))
+            ask.append(np.fromiter((t.ask for t in ticks), dtype=np.float64, count=n))
+        return {
+            'symbol_id': np.concatenate(symbol_ids),
+            'ts': np.concatenate(ts),
+            'price': np.concatenate(price),
+            'volume': np.concatenate(volume),
+            'bid': np.concatenate(bid),
+            'ask': np.concatenate(ask)
+        }
+
     def _calculate_results(self, elapsed_seconds: float, total_ticks: int) -> dict:
         """Calculate backtest performance metrics"""
 
@@ -586,35 +1414,41 @@ class TickBacktester:
         total_return = (total_pnl / self.initial_balance) * 100
 
         # Trade statistics
-        total_trades = len(self.trades)
-        winning_trades = [t for t in self.trades if t['pnl'] > 0]
-        losing_trades = [t for t in self.trades if t['pnl'] <= 0]
+        total_trades = self._trade_n
+        pnl = self._trades['pnl'][:total_trades]
+        wins = pnl > 0
+        winning_trades = int(wins.sum())
+        losing_trades = total_trades - winning_trades
 
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
+        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
 
         # Profit factor
-        gross_profit = sum(t['pnl'] for t in winning_trades)
-        gross_loss = abs(sum(t['pnl'] for t in losing_trades))
+        gross_profit = float(pnl[wins].sum())
+        gross_loss = abs(float(pnl[~wins].sum()))
         profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else 0
 
         # Sharpe ratio (using equity curve)
-        if len(self.equity_curve) > 1:
-            returns = []
-            for i in range(1, len(self.equity_curve)):
-                prev = self.equity_curve[i-1]['total_equity']
-                curr = self.equity_curve[i]['total_equity']
-                if prev > 0:
-                    returns.append((curr - prev) / prev)
-
-            if returns:
-                sharpe = (np.mean(returns) / np.std(returns)) * np.sqrt(252) if np.std(returns) > 0 else 0
-            else:
-                sharpe = 0
+        equity = self._eq_tot[:self._eq_n]
+        prev = equity[:-1]
+        valid = prev > 0
+        returns = np.diff(equity)[valid] / prev[valid]
+        if returns.size:
+            returns_std = returns.std()
+            sharpe = float((returns.mean() / returns_std) * np.sqrt(252)) if returns_std > 0 else 0
         else:
             sharpe = 0
 
-        # Max drawdown
-        max_dd = ((self.max_balance - self.min_balance) / self.max_balance * 100) if self.max_balance > 0 else 0
+        # Balance extremes, from the realized balance after each trade
+        balance_after = self._trades['balance_after'][:total_trades]
+        max_balance = float(np.max(balance_after, initial=self.initial_balance))
+        min_balance = float(np.min(balance_after, initial=self.initial_balance))
+
+        # Max drawdown: largest peak-to-trough equity decline, in time order
+        # (max_balance - min_balance ignored whether the trough came after the peak)
+        curve = np.concatenate(([self.initial_balance], equity))
+        running_max = np.maximum.accumulate(curve)
+        valid = running_max > 0
+        max_dd = float(((running_max[valid] - curve[valid]) / running_max[valid]).max() * 100) if valid.any() else 0
 
         return {
             'initial_balance': self.initial_balance,
@@ -622,21 +1456,21 @@ class TickBacktester:
             'total_pnl': total_pnl,
             'total_return': total_return,
             'total_trades': total_trades,
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
+            'winning_trades': winning_trades,
+            'losing_trades': losing_trades,
             'win_rate': win_rate,
             'profit_factor': profit_factor,
             'sharpe_ratio': sharpe,
             'max_drawdown': max_dd,
-            'max_balance': self.max_balance,
-            'min_balance': self.min_balance,
+            'max_balance': max_balance,
+            'min_balance': min_balance,
             'total_fees_paid': self.total_fees_paid,
             'fee_percentage': (self.total_fees_paid / abs(total_pnl) * 100) if total_pnl != 0 else 0,
             'total_ticks_processed': total_ticks,
             'elapsed_seconds': elapsed_seconds,
             'ticks_per_second': total_ticks / elapsed_seconds if elapsed_seconds > 0 else 0,
-            'trades': self.trades,
-            'equity_curve': self.equity_curve
+            'trades': self._trade_records(),
+            'equity_curve': self._equity_curve_records()
         }
 
 
@@ -658,8 +1492,9 @@ async def main():
     for symbol in symbols:
         file_path = Path(f"tick_data/{symbol.replace('/', '_')}_20251017.jsonl")
         if file_path.exists():
-            ticks = await backtester.load_tick_data_from_file(symbol, file_path, limit=100000)
-            tick_data[symbol] = ticks
+            columns = await backtester.load_tick_arrays_from_file(symbol, file_path, limit=100000)
+            if len(columns['ts']):
+                tick_data[symbol] = columns
 
     # Option 2: Collect live tick data (uncomment to use)
     # for symbol in symbols:
@@ -670,10 +1505,12 @@ async def main():
         # Run backtest
         results = await backtester.run_backtest(tick_data, progress_interval=5000)
 
-        # Save results
+        # Save results (orjson serializes NumPy scalars/arrays natively)
         output_file = Path('claudedocs/tick_backtest_results.json')
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        output_file.write_bytes(orjson.dumps(
+            results,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+        ))
 
         logger.info(f"✅ Results saved to {output_file}")
     else:
@@ -12,14 +12,29 @@ Latency: < 500ms target (vs 0-3,600,000ms with 1h candles)
 import asyncio
 import json
 import logging
+import os
+import random
 from datetime import datetime, timedelta
-from typing import Dict, List, Deque, Optional
-from collections import deque
+from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
+import numpy as np
+import orjson
 import websockets
 import pandas as pd
+from dateutil.tz import tzlocal
 from pathlib import Path
 
+try:  # optional: Parquet tick files (save_to_disk_format='parquet')
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:  # optional: libuv event loop (ships with uvicorn[standard]; not on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -27,7 +42,49 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Buffers accepted by one os.writev() call
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if 'SC_IOV_MAX' in getattr(os, 'sysconf_names', {}) else 1024
+
+# Ticks per Parquet row group (Parquet files are flushed in these blocks)
+PARQUET_ROW_GROUP_TICKS = 1000
+
+# Reconnect backoff: doubles per consecutive failure up to the cap, with
+# jitter so dropped connections don't all retry at the same instant
+RECONNECT_BASE_DELAY = 1.0
+RECONNECT_MAX_DELAY = 60.0
+
+# Binance caps the number of streams on one combined-stream connection
+MAX_STREAMS_PER_CONNECTION = 200
+
+
+def _utc_offset(ts_ns: int) -> timedelta:
+    """Local UTC offset at a ns-since-epoch timestamp"""
+    return datetime.fromtimestamp(ts_ns / 1_000_000_000).astimezone().utcoffset()
+
+
+def _reconnect_delay(failures: int) -> float:
+    """Seconds to wait before reconnect attempt number `failures` (1-based)"""
+    delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** min(failures - 1, 6))
+    return delay * (0.5 + random.random())
+
+
+def _local_timestamps(ts_ns: np.ndarray) -> pd.DatetimeIndex:
+    """Naive local times (like Tick.timestamp) for time-ordered ns timestamps
+
+    Ranges of a few minutes share one UTC offset unless a DST switch falls
+    inside, so the per-element timezone conversion is only the fallback.
+    """
+    first_offset = _utc_offset(ts_ns[0])
+    if first_offset == _utc_offset(ts_ns[-1]):
+        return pd.to_datetime(ts_ns + int(first_offset.total_seconds() * 1_000_000_000), unit='ns')
+    return (
+        pd.to_datetime(ts_ns, unit='ns', utc=True)
+        .tz_convert(tzlocal())
+        .tz_localize(None)
+    )
+
+
+@dataclass(slots=True)
 class Tick:
     """Single tick data point"""
     symbol: str
@@ -56,6 +113,107 @@ class Tick:
             'price_change_pct': self.price_change_pct
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize as one JSON Lines record (same fields as to_dict)
+
+        orjson encodes the dataclass and its datetime natively, so no
+        intermediate dict or isoformat string is built.
+        """
+        return orjson.dumps(self, option=orjson.OPT_APPEND_NEWLINE)
+
+
+class TickRing:
+    """Fixed-capacity circular tick buffer, one preallocated NumPy array per field
+
+    The receive loop writes plain numbers; Tick objects are only built when
+    a consumer asks for them (to_ticks, latest, iteration).
+    """
+
+    # Tick fields after symbol/timestamp, in Tick constructor order
+    FIELDS = (
+        'price', 'bid', 'ask', 'bid_qty', 'ask_qty',
+        'volume_24h', 'quote_volume_24h', 'price_change_pct'
+    )
+
+    def __init__(self, symbol: str, capacity: int):
+        self.symbol = symbol
+        self.capacity = capacity
+        self.ts_ns = np.empty(capacity, np.int64)  # event time, ns since epoch
+        self.price = np.empty(capacity, np.float64)
+        self.bid = np.empty(capacity, np.float64)
+        self.ask = np.empty(capacity, np.float64)
+        self.bid_qty = np.empty(capacity, np.float64)
+        self.ask_qty = np.empty(capacity, np.float64)
+        self.volume_24h = np.empty(capacity, np.float64)
+        self.quote_volume_24h = np.empty(capacity, np.float64)
+        self.price_change_pct = np.empty(capacity, np.float64)
+        self.head = 0   # next write position
+        self.count = 0  # ticks held (<= capacity)
+        self.version = 0  # bumped on every write; cached derived results key on it
+        # (version, lookback_seconds, summary) memo of
+        # TickIndicators.generate_tick_summary for this buffer
+        self.summary_cache: Optional[tuple] = None
+
+    def append(
+        self,
+        ts_ns: int,
+        price: float,
+        bid: float,
+        ask: float,
+        bid_qty: float,
+        ask_qty: float,
+        volume_24h: float,
+        quote_volume_24h: float,
+        price_change_pct: float
+    ):
+        """Write one tick, overwriting the oldest once full"""
+        i = self.head
+        self.ts_ns[i] = ts_ns
+        self.price[i] = price
+        self.bid[i] = bid
+        self.ask[i] = ask
+        self.bid_qty[i] = bid_qty
+        self.ask_qty[i] = ask_qty
+        self.volume_24h[i] = volume_24h
+        self.quote_volume_24h[i] = quote_volume_24h
+        self.price_change_pct[i] = price_change_pct
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self.version += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        return iter(self.to_ticks())
+
+    def indices(self, n: Optional[int] = None) -> np.ndarray:
+        """Buffer positions of the last n ticks (None = all), oldest first"""
+        n = self.count if n is None else max(0, min(n, self.count))
+        return np.arange(self.head - n, self.head) % self.capacity
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """Copy of one field for the last n ticks, oldest first"""
+        return getattr(self, name)[self.indices(n)]
+
+    def to_ticks(self, n: Optional[int] = None) -> List[Tick]:
+        """Materialize the last n ticks (None = all) as Tick objects"""
+        idx = self.indices(n)
+        columns = [getattr(self, name)[idx].tolist() for name in self.FIELDS]
+        return [
+            Tick(self.symbol, datetime.fromtimestamp(ts_ns / 1_000_000_000), *values)
+            for ts_ns, *values in zip(self.ts_ns[idx].tolist(), *columns)
+        ]
+
+    def latest_ts_ns(self) -> Optional[int]:
+        """Event time of the most recent tick (ns since epoch), or None when empty"""
+        return int(self.ts_ns[self.head - 1]) if self.count else None
+
+    def latest(self) -> Optional[Tick]:
+        """Most recent tick, or None when empty"""
+        return self.to_ticks(1)[0] if self.count else None
+
 
 class TickDataCollector:
     """Real-time tick data collector using Binance Futures WebSocket
@@ -69,7 +227,8 @@ class TickDataCollector:
         symbols: List[str],
         buffer_size: int = 10000,
         save_to_disk: bool = False,
-        data_dir: str = "tick_data"
+        data_dir: str = "tick_data",
+        save_to_disk_format: str = "jsonl"
     ):
         """Initialize tick data collector
 
@@ -78,10 +237,18 @@ class TickDataCollector:
             buffer_size: Number of ticks to keep in memory per symbol (default: 10,000)
             save_to_disk: Whether to save ticks to disk for backtesting
             data_dir: Directory to save tick data files
+            save_to_disk_format: 'jsonl' (one JSON tick per line) or 'parquet'
+                (columnar, one file per symbol per session-day; needs pyarrow)
         """
+        if save_to_disk_format not in ('jsonl', 'parquet'):
+            raise ValueError(f"Invalid save_to_disk_format: {save_to_disk_format}")
+        if save_to_disk and save_to_disk_format == 'parquet' and pq is None:
+            raise ValueError("save_to_disk_format='parquet' requires pyarrow")
+
         self.symbols = symbols
         self.buffer_size = buffer_size
         self.save_to_disk = save_to_disk
+        self.save_to_disk_format = save_to_disk_format
         self.data_dir = Path(data_dir)
 
         # Create data directory if saving to disk
@@ -89,8 +256,8 @@ class TickDataCollector:
             self.data_dir.mkdir(exist_ok=True)
 
         # In-memory circular buffers (10,000 ticks per symbol = ~16 minutes at 10 ticks/sec)
-        self.tick_buffers: Dict[str, Deque[Tick]] = {
-            symbol: deque(maxlen=buffer_size) for symbol in symbols
+        self.tick_buffers: Dict[str, TickRing] = {
+            symbol: TickRing(symbol, buffer_size) for symbol in symbols
         }
 
         # WebSocket connection tracking
@@ -99,9 +266,15 @@ class TickDataCollector:
 
         # Statistics
         self.tick_counts: Dict[str, int] = {symbol: 0 for symbol in symbols}
-        self.last_tick_time: Dict[str, datetime] = {}
         self.reconnect_counts: Dict[str, int] = {symbol: 0 for symbol in symbols}
 
+        # Disk persistence: serialized batches are queued per symbol and
+        # appended by a writer task, off the receive loop
+        self._write_queues: Dict[str, asyncio.Queue] = {}
+        self._writer_tasks: Dict[str, asyncio.Task] = {}
+        self._files: Dict[str, tuple] = {}  # symbol -> (date_str, O_APPEND fd or ParquetWriter)
+        self._flushed_counts: Dict[str, int] = {symbol: 0 for symbol in symbols}  # tick_counts at last flush
+
         # Running flag
         self.is_running = False
 
@@ -122,6 +295,69 @@ class TickDataCollector:
         exchange_symbol = symbol.replace('/', '').lower()
         return f"wss://fstream.binance.com/ws/{exchange_symbol}@ticker"
 
+    def get_combined_ws_url(self, symbols: List[str]) -> str:
+        """Get multiplexed WebSocket URL carrying the ticker streams of several symbols
+
+        Messages arrive wrapped as {"stream": "btcusdt@ticker", "data": {...}}.
+        """
+        streams = '/'.join(f"{symbol.replace('/', '').lower()}@ticker" for symbol in symbols)
+        return f"wss://fstream.binance.com/stream?streams={streams}"
+
+    def _make_ticker_handler(self, symbol: str):
+        """Build the per-message handler for a symbol
+
+        Called once per subscribe_* call, not per connection: the same
+        closure keeps handling messages after a reconnect. Buffer, counters
+        and settings are bound here, so the receive loop does no attribute or
+        dict lookups beyond the tick count. tick_buffers, tick_counts and the
+        settings are never replaced, so there is nothing to rebind on
+        reconnect.
+        """
+        tick_buffer = self.tick_buffers[symbol]
+        append = tick_buffer.append
+        tick_counts = self.tick_counts
+        save_to_disk = self.save_to_disk
+        save_ticks = self._save_ticks_to_disk
+        buffer_size = self.buffer_size
+        # Ticks until the next every-100 save/log (kept aligned with tick_counts
+        # across reconnects)
+        countdown = 100 - tick_counts[symbol] % 100
+
+        def handle(data: dict):
+            nonlocal countdown
+            # Parse tick data straight into the ring buffer
+            # (no Tick object per message)
+            price = float(data['c'])
+            append(
+                int(data['E']) * 1_000_000,  # Event time (ms -> ns)
+                price,                       # Last price
+                float(data['b']),            # Best bid
+                float(data['a']),            # Best ask
+                float(data['B']),            # Best bid qty
+                float(data['A']),            # Best ask qty
+                float(data['v']),            # 24h volume
+                float(data['q']),            # 24h quote volume
+                float(data['P'])             # 24h price change %
+            )
+            tick_counts[symbol] += 1
+
+            countdown -= 1
+            if not countdown:
+                countdown = 100
+                # Save to disk if enabled
+                if save_to_disk:
+                    save_ticks(symbol)
+
+                # Log every 100 ticks
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"{symbol}: {tick_counts[symbol]:,} ticks | "
+                        f"Price: ${price:,.2f} | "
+                        f"Buffer: {len(tick_buffer):,}/{buffer_size:,}"
+                    )
+
+        return handle
+
     async def subscribe_ticker_stream(self, symbol: str):
         """Subscribe to real-time ticker stream for a symbol
 
@@ -129,12 +365,17 @@ class TickDataCollector:
         NO candle data is used.
         """
         ws_url = self.get_ws_url(symbol)
+        handle = self._make_ticker_handler(symbol)
+        loads = orjson.loads
+        failures = 0  # consecutive failed connections (reset once ticks flow)
 
         while self.is_running:
             try:
                 logger.info(f"📡 Connecting to {symbol} ticker stream...")
 
-                async with websockets.connect(ws_url) as websocket:
+                # No permessage-deflate: ticker frames are tiny, so inflating
+                # each one costs more than the bandwidth it saves
+                async with websockets.connect(ws_url, compression=None) as websocket:
                     self.ws_connections[symbol] = websocket
                     self.connection_status[symbol] = True
                     logger.info(f"✅ Connected to {symbol} stream")
@@ -143,75 +384,249 @@ class TickDataCollector:
                     async for message in websocket:
                         if not self.is_running:
                             break
+                        if failures:
+                            failures = 0
 
                         try:
-                            data = json.loads(message)
-
-                            # Parse tick data
-                            tick = Tick(
-                                symbol=symbol,
-                                timestamp=datetime.fromtimestamp(data['E'] / 1000),
-                                price=float(data['c']),          # Last price
-                                bid=float(data['b']),            # Best bid
-                                ask=float(data['a']),            # Best ask
-                                bid_qty=float(data['B']),        # Best bid qty
-                                ask_qty=float(data['A']),        # Best ask qty
-                                volume_24h=float(data['v']),     # 24h volume
-                                quote_volume_24h=float(data['q']), # 24h quote volume
-                                price_change_pct=float(data['P']) # 24h price change %
-                            )
-
-                            # Store in buffer
-                            self.tick_buffers[symbol].append(tick)
-                            self.tick_counts[symbol] += 1
-                            self.last_tick_time[symbol] = tick.timestamp
-
-                            # Save to disk if enabled
-                            if self.save_to_disk and self.tick_counts[symbol] % 100 == 0:
-                                await self._save_ticks_to_disk(symbol)
-
-                            # Log every 100 ticks
-                            if self.tick_counts[symbol] % 100 == 0:
-                                logger.debug(
-                                    f"{symbol}: {self.tick_counts[symbol]:,} ticks | "
-                                    f"Price: ${tick.price:,.2f} | "
-                                    f"Buffer: {len(self.tick_buffers[symbol]):,}/{self.buffer_size:,}"
-                                )
-
-                        except Exception as e:
-                            logger.error(f"Error processing {symbol} tick: {e}")
+                            data = loads(message)  # orjson accepts str or bytes frames
+                        except orjson.JSONDecodeError as e:
+                            logger.error(f"Error decoding {symbol} message: {e}")
                             continue
 
+                        # Skip control frames (e.g. subscription acks) without raising
+                        if type(data) is not dict or data.get('e') != '24hrTicker':
+                            continue
+
+                        try:
+                            handle(data)
+                        except (KeyError, TypeError, ValueError) as e:
+                            logger.error(f"Error processing {symbol} tick: {e}")
+
             except websockets.exceptions.ConnectionClosed:
                 self.connection_status[symbol] = False
-                logger.warning(f"⚠️  {symbol} connection closed, reconnecting in 5s...")
+                failures += 1
+                delay = _reconnect_delay(failures)
+                logger.warning(f"⚠️  {symbol} connection closed, reconnecting in {delay:.1f}s...")
                 self.reconnect_counts[symbol] += 1
-                await asyncio.sleep(5)
+                await asyncio.sleep(delay)
 
             except Exception as e:
                 self.connection_status[symbol] = False
-                logger.error(f"❌ {symbol} WebSocket error: {e}")
+                failures += 1
+                delay = _reconnect_delay(failures)
+                logger.error(f"❌ {symbol} WebSocket error: {e} (reconnecting in {delay:.1f}s)")
                 self.reconnect_counts[symbol] += 1
-                await asyncio.sleep(5)
+                await asyncio.sleep(delay)
 
-    async def _save_ticks_to_disk(self, symbol: str):
-        """Save recent ticks to disk for backtesting"""
-        try:
-            # Get last 100 ticks
-            recent_ticks = list(self.tick_buffers[symbol])[-100:]
+    async def subscribe_combined_stream(self, symbols: List[str]):
+        """Subscribe to the ticker streams of several symbols over one connection
 
-            # Create filename with date
-            date_str = datetime.now().strftime('%Y%m%d')
-            filename = self.data_dir / f"{symbol.replace('/', '_')}_{date_str}.jsonl"
+        Same ticks as subscribe_ticker_stream, but one TCP/TLS session and one
+        receive task for the whole group. Messages are dispatched to each
+        symbol's buffer by stream name; reconnects are counted per symbol.
+        """
+        ws_url = self.get_combined_ws_url(symbols)
+        stream_handlers = {
+            f"{symbol.replace('/', '').lower()}@ticker": self._make_ticker_handler(symbol)
+            for symbol in symbols
+        }
+        loads = orjson.loads
+        label = ', '.join(symbols)
+        failures = 0  # consecutive failed connections (reset once ticks flow)
+
+        while self.is_running:
+            try:
+                logger.info(f"📡 Connecting to combined ticker stream ({label})...")
+
+                # No permessage-deflate (see subscribe_ticker_stream)
+                async with websockets.connect(ws_url, compression=None) as websocket:
+                    for symbol in symbols:
+                        self.ws_connections[symbol] = websocket
+                        self.connection_status[symbol] = True
+                    logger.info(f"✅ Connected to combined stream ({len(symbols)} symbols)")
+
+                    # Receive and process ticks
+                    async for message in websocket:
+                        if not self.is_running:
+                            break
+                        if failures:
+                            failures = 0
+
+                        try:
+                            envelope = loads(message)
+                        except orjson.JSONDecodeError as e:
+                            logger.error(f"Error decoding combined stream message: {e}")
+                            continue
+
+                        # Skip control frames and streams we did not ask for
+                        if type(envelope) is not dict:
+                            continue
+                        handle = stream_handlers.get(envelope.get('stream'))
+                        data = envelope.get('data')
+                        if handle is None or type(data) is not dict or data.get('e') != '24hrTicker':
+                            continue
+
+                        try:
+                            handle(data)
+                        except (KeyError, TypeError, ValueError) as e:
+                            logger.error(f"Error processing {envelope['stream']} tick: {e}")
 
-            # Append to file (JSON Lines format)
-            with open(filename, 'a') as f:
-                for tick in recent_ticks:
-                    f.write(json.dumps(tick.to_dict()) + '\n')
+            except websockets.exceptions.ConnectionClosed:
+                failures += 1
+                delay = _reconnect_delay(failures)
+                logger.warning(f"⚠️  Combined stream ({label}) closed, reconnecting in {delay:.1f}s...")
+                self._mark_disconnected(symbols)
+                await asyncio.sleep(delay)
+
+            except Exception as e:
+                failures += 1
+                delay = _reconnect_delay(failures)
+                logger.error(f"❌ Combined stream ({label}) WebSocket error: {e} (reconnecting in {delay:.1f}s)")
+                self._mark_disconnected(symbols)
+                await asyncio.sleep(delay)
+
+    def _mark_disconnected(self, symbols: List[str]):
+        """Record a dropped connection for every symbol it carried"""
+        for symbol in symbols:
+            self.connection_status[symbol] = False
+            self.reconnect_counts[symbol] += 1
+
+    def _save_ticks_to_disk(self, symbol: str, force: bool = False):
+        """Queue ticks received since the last flush for the symbol's disk writer
+
+        Parquet output waits for a full row group of ticks unless forced.
+        """
+        try:
+            # Only the range since the previous flush, so flushes never
+            # overlap or skip ticks (capped at what the ring still holds)
+            pending = self.tick_counts[symbol] - self._flushed_counts[symbol]
+            if pending <= 0:
+                return
+            parquet = self.save_to_disk_format == 'parquet'
+            if parquet and not force and pending < min(PARQUET_ROW_GROUP_TICKS, self.buffer_size):
+                return
+            buffer = self.tick_buffers[symbol]
+            if pending > len(buffer):
+                logger.warning(f"⚠️  {symbol}: {pending - len(buffer)} ticks left the buffer before flush")
+            self._flushed_counts[symbol] = self.tick_counts[symbol]
+
+            # Serialized here so the writer only does I/O
+            if parquet:
+                data = self._ticks_to_table(buffer, pending)
+            else:
+                data = b''.join([tick.to_json_bytes() for tick in buffer.to_ticks(pending)])
+
+            if symbol not in self._writer_tasks:
+                self._write_queues[symbol] = asyncio.Queue()
+                self._writer_tasks[symbol] = asyncio.create_task(self._disk_writer(symbol))
+            self._write_queues[symbol].put_nowait(data)
 
         except Exception as e:
             logger.error(f"Error saving {symbol} ticks to disk: {e}")
 
+    @staticmethod
+    def _ticks_to_table(buffer: TickRing, n: int) -> 'pa.Table':
+        """Last n ticks of a buffer as an Arrow table (same fields as Tick.to_dict)"""
+        idx = buffer.indices(n)
+        columns = {
+            'symbol': pa.array([buffer.symbol] * len(idx), pa.string()),
+            'timestamp': pa.array(_local_timestamps(buffer.ts_ns[idx]).values, pa.timestamp('ns'))
+        }
+        columns.update({name: getattr(buffer, name)[idx] for name in TickRing.FIELDS})
+        return pa.table(columns)
+
+    async def _disk_writer(self, symbol: str):
+        """Append queued batches for a symbol until a None sentinel arrives
+
+        Everything already queued goes out in one scatter write, which runs
+        in the default executor so file I/O never blocks the event loop.
+        """
+        queue = self._write_queues[symbol]
+        loop = asyncio.get_running_loop()
+        append = self._append_to_parquet if self.save_to_disk_format == 'parquet' else self._append_to_file
+        done = False
+
+        while not done:
+            batches = [await queue.get()]
+            while not queue.empty():
+                batches.append(queue.get_nowait())
+            if None in batches:
+                done = True
+                batches = batches[:batches.index(None)]
+            if not batches:
+                continue
+
+            try:
+                await loop.run_in_executor(None, append, symbol, batches)
+            except Exception as e:
+                logger.error(f"Error saving {symbol} ticks to disk: {e}")
+
+    def _append_to_file(self, symbol: str, batches: List[bytes]):
+        """Append JSON Lines batches to the symbol's file for today
+
+        The file stays open as a raw O_APPEND descriptor, so each call is a
+        single writev() syscall (no Python-level buffering or join).
+        """
+        # Create filename with date (a new file is opened when the date rolls)
+        date_str = datetime.now().strftime('%Y%m%d')
+        current = self._files.get(symbol)
+        if current is None or current[0] != date_str:
+            if current is not None:
+                os.close(current[1])
+            filename = self.data_dir / f"{symbol.replace('/', '_')}_{date_str}.jsonl"
+            fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._files[symbol] = current = (date_str, fd)
+
+        fd = current[1]
+        if hasattr(os, 'writev') and len(batches) <= _IOV_MAX:
+            written = os.writev(fd, batches)
+            total = sum(len(batch) for batch in batches)
+            if written == total:
+                return
+            data = b''.join(batches)[written:]  # short write: finish the tail
+        else:
+            data = b''.join(batches)  # Windows, or too many buffers for one call
+
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def _append_to_parquet(self, symbol: str, tables: List['pa.Table']):
+        """Write Arrow tables to the symbol's Parquet file for today
+
+        A Parquet file is only readable once closed (at date rollover or
+        stop()), so each session gets its own file rather than reopening one.
+        """
+        date_str = datetime.now().strftime('%Y%m%d')
+        current = self._files.get(symbol)
+        if current is None or current[0] != date_str:
+            if current is not None:
+                current[1].close()
+            stem = f"{symbol.replace('/', '_')}_{date_str}"
+            filename = self.data_dir / f"{stem}.parquet"
+            if filename.exists():
+                filename = self.data_dir / f"{stem}_{datetime.now().strftime('%H%M%S')}.parquet"
+            writer = pq.ParquetWriter(filename, tables[0].schema, compression='zstd')
+            self._files[symbol] = current = (date_str, writer)
+
+        current[1].write_table(pa.concat_tables(tables))
+
+    async def _close_disk_writers(self):
+        """Flush pending batches and close the tick files"""
+        for queue in self._write_queues.values():
+            queue.put_nowait(None)
+        if self._writer_tasks:
+            await asyncio.gather(*self._writer_tasks.values(), return_exceptions=True)
+        self._write_queues.clear()
+        self._writer_tasks.clear()
+
+        for _, handle in self._files.values():
+            if self.save_to_disk_format == 'parquet':
+                handle.close()
+            else:
+                os.close(handle)
+        self._files.clear()
+
     async def start(self):
         """Start collecting tick data for all symbols"""
         logger.info("\n" + "="*80)
@@ -224,10 +639,12 @@ class TickDataCollector:
 
         self.is_running = True
 
-        # Create tasks for each symbol
+        # One multiplexed connection per group of symbols
         tasks = [
-            asyncio.create_task(self.subscribe_ticker_stream(symbol))
-            for symbol in self.symbols
+            asyncio.create_task(self.subscribe_combined_stream(
+                self.symbols[i:i + MAX_STREAMS_PER_CONNECTION]
+            ))
+            for i in range(0, len(self.symbols), MAX_STREAMS_PER_CONNECTION)
         ]
 
         # Run all streams concurrently
@@ -254,6 +671,12 @@ class TickDataCollector:
             except Exception as e:
                 logger.error(f"Error closing {symbol} connection: {e}")
 
+        # Flush ticks received since the last periodic save
+        if self.save_to_disk:
+            for symbol in self.symbols:
+                self._save_ticks_to_disk(symbol, force=True)
+        await self._close_disk_writers()
+
         # Display final statistics
         logger.info("\n" + "="*80)
         logger.info("📊 TICK COLLECTION SUMMARY")
@@ -267,6 +690,14 @@ class TickDataCollector:
             )
         logger.info("="*80 + "\n")
 
+    @property
+    def last_tick_time(self) -> Dict[str, datetime]:
+        """Event time of the latest tick per symbol (built on demand from the buffers)"""
+        return {
+            symbol: datetime.fromtimestamp(buffer.latest_ts_ns() / 1_000_000_000)
+            for symbol, buffer in self.tick_buffers.items() if len(buffer)
+        }
+
     def get_recent_ticks(self, symbol: str, count: int = 100) -> List[Tick]:
         """Get recent ticks for a symbol
 
@@ -277,8 +708,10 @@ class TickDataCollector:
         Returns:
             List of Tick objects, most recent last
         """
-        buffer = self.tick_buffers.get(symbol, deque())
-        return list(buffer)[-count:]
+        buffer = self.tick_buffers.get(symbol)
+        if buffer is None:
+            return []
+        return buffer.to_ticks(count or None)
 
     def get_tick_buffer_as_df(self, symbol: str, count: Optional[int] = None) -> pd.DataFrame:
         """Get tick buffer as pandas DataFrame for analysis
@@ -290,21 +723,22 @@ class TickDataCollector:
         Returns:
             DataFrame with columns: timestamp, price, bid, ask, volume_24h, etc.
         """
-        ticks = self.get_recent_ticks(symbol, count) if count else list(self.tick_buffers[symbol])
-
-        if not ticks:
+        buffer = self.tick_buffers.get(symbol)
+        if not buffer:
             return pd.DataFrame()
 
-        df = pd.DataFrame([tick.to_dict() for tick in ticks])
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df.set_index('timestamp', inplace=True)
+        # Columns straight from the ring arrays (no per-tick dicts)
+        idx = buffer.indices(count or None)
+        columns = {'symbol': symbol}
+        columns.update({name: getattr(buffer, name)[idx] for name in TickRing.FIELDS})
 
-        return df
+        timestamps = _local_timestamps(buffer.ts_ns[idx])
+        return pd.DataFrame(columns, index=pd.Index(timestamps, name='timestamp'))
 
     def get_latest_tick(self, symbol: str) -> Optional[Tick]:
         """Get most recent tick for a symbol"""
-        buffer = self.tick_buffers.get(symbol, deque())
-        return buffer[-1] if buffer else None
+        buffer = self.tick_buffers.get(symbol)
+        return buffer.latest() if buffer is not None else None
 
     def get_statistics(self) -> dict:
         """Get collection statistics"""
@@ -325,6 +759,13 @@ class TickDataCollector:
         }
 
 
+def run_event_loop(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
 async def main():
     """Test tick data collector"""
     # Load active symbols from config
@@ -353,4 +794,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -9,15 +9,404 @@ Traditional indicators like SMA, ATR, RSI assume OHLCV candles.
 Tick-based indicators use time-weighted and volume-weighted calculations instead.
 """
 import numpy as np
-import pandas as pd
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 from collections import deque
+from bisect import bisect_left
+from operator import attrgetter
 import logging
 
+from _njit import njit
+
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Array kernels
+#
+# NumPy equivalents of the List[Tick] indicators below. They take parallel
+# arrays (timestamps as int64 nanoseconds, ascending) so the lookback window
+# is found with a binary search and used as a zero-copy slice.
+# ---------------------------------------------------------------------------
+
+NS_PER_SECOND = 1_000_000_000
+
+
+def _window_start(ts_ns: np.ndarray, lookback_seconds: int) -> int:
+    """Index of the first tick within lookback_seconds of the last tick"""
+    return int(np.searchsorted(ts_ns, ts_ns[-1] - lookback_seconds * NS_PER_SECOND, side='left'))
+
+
+def _window_columns(ticks, lookback_seconds: int, fields: Tuple[str, ...]) -> Tuple[float, List[np.ndarray]]:
+    """Columns of the ticks within lookback_seconds of the last tick
+
+    Accepts a List[Tick] (ascending timestamps) or a TickRing from
+    tick_data_collector. The window start is found by binary search, and
+    only the window's ticks are read.
+
+    Returns:
+        (seconds from the window's first to last tick, one array per field)
+    """
+    if hasattr(ticks, 'ts_ns'):  # TickRing: fields are already arrays
+        ts_ns = ticks.column('ts_ns')
+        start = _window_start(ts_ns, lookback_seconds)
+        n = len(ts_ns) - start
+        return (ts_ns[-1] - ts_ns[start]) / NS_PER_SECOND, [ticks.column(f, n) for f in fields]
+
+    window = _window_ticks(ticks, lookback_seconds)
+    span = (window[-1].timestamp - window[0].timestamp).total_seconds()
+    return span, [np.fromiter(map(attrgetter(f), window), np.float64, len(window)) for f in fields]
+
+
+def _window_ticks(ticks: List, lookback_seconds: int) -> List:
+    """Ticks of a List[Tick] within lookback_seconds of the last tick (binary search)"""
+    cutoff_time = ticks[-1].timestamp - timedelta(seconds=lookback_seconds)
+    return ticks[bisect_left(ticks, cutoff_time, key=_timestamp):]
+
+
+def _last_price(ticks) -> float:
+    """Price of the most recent tick (List[Tick] or TickRing)"""
+    if hasattr(ticks, 'ts_ns'):
+        return float(ticks.column('price', 1)[0])
+    return ticks[-1].price
+
+
+_timestamp = attrgetter('timestamp')
+
+
+def _vwap(prices: np.ndarray, volumes: np.ndarray) -> float:
+    """VWAP of a window (simple average when volume is zero)"""
+    total_volume = volumes.sum()
+    if total_volume == 0:
+        return float(prices.mean())
+    return float(np.dot(prices, volumes) / total_volume)
+
+
+def _window_vwaps(prices: np.ndarray, volumes: np.ndarray, starts: List[int]) -> List[float]:
+    """VWAPs of prices[start:] for several starts, from one set of suffix sums
+
+    Every window ends at the last tick, so the sums are accumulated backwards
+    from it and each window reads its total directly (no prefix-sum
+    differences, hence no cancellation for short windows).
+    """
+    n = len(prices)
+    first = min(starts)
+    pv = np.cumsum((prices[first:] * volumes[first:])[::-1])
+    v = np.cumsum(volumes[first:][::-1])
+    p = np.cumsum(prices[first:][::-1])
+    vwaps = []
+    for start in starts:
+        k = n - start - 1  # suffix index of the window's first tick
+        vwaps.append(float(p[k] / (n - start) if v[k] == 0 else pv[k] / v[k]))
+    return vwaps
+
+
+def _tick_volatility(prices: np.ndarray) -> float:
+    """Std of absolute tick-to-tick price changes of a window"""
+    if len(prices) < 2:
+        return 0.0
+    return float(_abs_change_std_kernel(prices))
+
+
+@njit(cache=True)
+def _abs_change_std_kernel(prices):
+    """Population std of |prices[i] - prices[i-1]|
+
+    Two passes over prices (mean, then squared deviations) with no diff/abs
+    temporaries, unlike np.std(np.abs(np.diff(prices))).
+    """
+    n = prices.shape[0] - 1
+    if n <= 0:
+        return 0.0
+    total = 0.0
+    for i in range(1, n + 1):
+        total += abs(prices[i] - prices[i - 1])
+    mean = total / n
+    m2 = 0.0
+    for i in range(1, n + 1):
+        deviation = abs(prices[i] - prices[i - 1]) - mean
+        m2 += deviation * deviation
+    return np.sqrt(m2 / n)
+
+
+def _atr_like_volatility(prices: np.ndarray, window_size: int = 100) -> float:
+    """Mean high-low range over consecutive window_size blocks of a window"""
+    # Same block count as range(0, len - window_size, window_size)
+    num_windows = max(0, -(-(len(prices) - window_size) // window_size))
+    if len(prices) < window_size or num_windows == 0:
+        return 0.0
+    blocks = prices[:num_windows * window_size].reshape(num_windows, window_size)
+    return float(np.mean(blocks.max(axis=1) - blocks.min(axis=1)))
+
+
+def _momentum(prices: np.ndarray, ts_ns: np.ndarray) -> float:
+    """Percentage change per second across a window"""
+    if len(prices) < 2 or prices[0] == 0:
+        return 0.0
+    time_elapsed = (ts_ns[-1] - ts_ns[0]) / NS_PER_SECOND
+    if time_elapsed == 0:
+        return 0.0
+    pct_change = ((prices[-1] - prices[0]) / prices[0]) * 100
+    return float(pct_change / time_elapsed)
+
+
+@njit(cache=True)
+def _window_stats_kernel(prices, volumes, i0, s0, l0, block_size):
+    """Fused single pass over the lookback windows
+
+    Accumulates, in one loop over prices[min(i0, s0, l0):]:
+    - VWAP sums for the main [i0:], short [s0:] and long [l0:] windows
+    - Welford mean/variance of |tick-to-tick change| (main window)
+    - high-low range per block_size block (main window, ATR-like)
+
+    Returns:
+        (vwap, short_vwap, long_vwap, std_volatility, atr_volatility)
+    """
+    n = prices.shape[0]
+    start = min(i0, s0, l0)
+
+    vol_main = 0.0
+    pv_main = 0.0
+    p_main = 0.0
+    vol_short = 0.0
+    pv_short = 0.0
+    p_short = 0.0
+    vol_long = 0.0
+    pv_long = 0.0
+    p_long = 0.0
+
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+
+    # Same block count as range(0, m - block_size, block_size)
+    m = n - i0
+    num_blocks = (m - 1) // block_size if m > block_size else 0
+    covered = num_blocks * block_size
+    high = -np.inf
+    low = np.inf
+    range_sum = 0.0
+
+    for i in range(start, n):
+        p = prices[i]
+        v = volumes[i]
+        if i >= l0:
+            vol_long += v
+            pv_long += p * v
+            p_long += p
+        if i >= s0:
+            vol_short += v
+            pv_short += p * v
+            p_short += p
+        if i >= i0:
+            vol_main += v
+            pv_main += p * v
+            p_main += p
+
+            if i > i0:
+                change = abs(p - prices[i - 1])
+                count += 1
+                delta = change - mean
+                mean += delta / count
+                m2 += delta * (change - mean)
+
+            j = i - i0
+            if j < covered:
+                if p > high:
+                    high = p
+                if p < low:
+                    low = p
+                if j % block_size == block_size - 1:
+                    range_sum += high - low
+                    high = -np.inf
+                    low = np.inf
+
+    # VWAP falls back to the simple average when there is no volume
+    vwap = pv_main / vol_main if vol_main != 0 else p_main / (n - i0)
+    short_vwap = pv_short / vol_short if vol_short != 0 else p_short / (n - s0)
+    long_vwap = pv_long / vol_long if vol_long != 0 else p_long / (n - l0)
+    std_volatility = np.sqrt(m2 / count) if count > 0 else 0.0
+    atr_volatility = range_sum / num_blocks if num_blocks > 0 else 0.0
+
+    return vwap, short_vwap, long_vwap, std_volatility, atr_volatility
+
+
+def _support_resistance(prices: np.ndarray) -> Tuple[float, float]:
+    """25th percentile below / 75th percentile above the last price"""
+    current_price = prices[-1]
+    below = prices[prices < current_price]
+    above = prices[prices > current_price]
+    support = _percentile(below, 0.25) if below.size else current_price * 0.99
+    resistance = _percentile(above, 0.75) if above.size else current_price * 1.01
+    return support, resistance
+
+
+def _percentile(values: np.ndarray, q: float) -> float:
+    """np.percentile(values, q * 100) from a partial partition
+
+    Same virtual index and interpolation as NumPy's default 'linear'
+    method, without its per-call overhead (dominant below ~5k values).
+    """
+    virtual = values.size * q + (1 - q) - 1
+    lo = int(virtual)
+    hi = min(lo + 1, values.size - 1)
+    part = np.partition(values, (lo, hi))
+    a, b = part[lo], part[hi]
+    gamma = virtual - lo
+    if gamma >= 0.5:
+        return b - (b - a) * (1 - gamma)
+    return a + (b - a) * gamma
+
+
+def _volume_profile(prices: np.ndarray, volumes: np.ndarray, num_bins: int = 20) -> dict:
+    """Volume-by-price histogram with point of control and 70% value area"""
+    min_price = prices.min()
+    max_price = prices.max()
+
+    if min_price == max_price:
+        return {
+            'poc': prices[-1],
+            'value_area_high': prices[-1],
+            'value_area_low': prices[-1]
+        }
+
+    # Same bin assignment as np.histogram on a uniform grid, including its
+    # corrections for values that land on an edge after rounding
+    bin_edges = np.linspace(min_price, max_price, num_bins + 1)
+    idx = ((prices - min_price) * (num_bins / (max_price - min_price))).astype(np.intp)
+    idx[idx == num_bins] -= 1
+    idx[prices < bin_edges[idx]] -= 1
+    idx[(prices >= bin_edges[idx + 1]) & (idx != num_bins - 1)] += 1
+    hist = np.bincount(idx, weights=volumes, minlength=num_bins)
+
+    poc_idx = np.argmax(hist)
+    poc = (bin_edges[poc_idx] + bin_edges[poc_idx + 1]) / 2
+
+    # Value area: widen one bin on each side per step until 70% of volume.
+    # At ~20 bins this walk is cheaper on Python floats than any NumPy form
+    bin_volumes = hist.tolist()
+    last_idx = len(bin_volumes) - 1
+    target_volume = sum(bin_volumes) * 0.70
+
+    cumsum = 0
+    low_idx = high_idx = int(poc_idx)
+
+    while cumsum < target_volume and (low_idx > 0 or high_idx < last_idx):
+        if low_idx > 0:
+            low_idx -= 1
+            cumsum += bin_volumes[low_idx]
+        if high_idx < last_idx and cumsum < target_volume:
+            high_idx += 1
+            cumsum += bin_volumes[high_idx]
+
+    return {
+        'poc': poc,
+        'value_area_high': bin_edges[high_idx + 1],
+        'value_area_low': bin_edges[low_idx],
+        'volume_distribution': list(hist),
+        'price_bins': list(bin_edges)
+    }
+
+
+def _bid_ask_spread(prices: np.ndarray, bids: np.ndarray, asks: np.ndarray) -> float:
+    """Average bid-ask spread as percentage of price (ticks with price > 0)"""
+    valid = prices > 0
+    if not valid.any():
+        return 0.0
+    return float(np.mean((asks[valid] - bids[valid]) / prices[valid] * 100))
+
+
+def _tick_summary(
+    prices: np.ndarray,
+    volumes: np.ndarray,
+    i0: int,
+    s0: int,
+    l0: int,
+    time_elapsed: float,
+    spread: float,
+    timestamp: str,
+    tick_count: int
+) -> dict:
+    """Summary dictionary from one fused pass over the lookback windows
+
+    prices/volumes cover at least the three windows; i0 (lookback), s0
+    (5 min) and l0 (30 min) index their first ticks. time_elapsed spans the
+    lookback window, and tick_count is the length of the full tick series.
+    """
+    vwap, short_vwap, long_vwap, volatility, atr_like = _window_stats_kernel(
+        prices, volumes, i0, s0, l0, 100
+    )
+    window_prices = prices[i0:]
+
+    # Momentum: percentage change per second across the lookback window
+    momentum = 0.0
+    if len(window_prices) >= 2 and window_prices[0] != 0 and time_elapsed != 0:
+        pct_change = ((window_prices[-1] - window_prices[0]) / window_prices[0]) * 100
+        momentum = float(pct_change / time_elapsed)
+
+    # Bollinger Bands: VWAP middle, ATR-like width
+    band_width = 2.0 * atr_like
+    upper_bb, middle_bb, lower_bb = vwap + band_width, vwap, vwap - band_width
+
+    # Trend: 5 min vs 30 min VWAP
+    trend = 'NEUTRAL'
+    if tick_count >= 2 and short_vwap != 0 and long_vwap != 0:
+        diff_pct = ((short_vwap - long_vwap) / long_vwap) * 100
+        if diff_pct > 0.5:
+            trend = 'BULLISH'
+        elif diff_pct < -0.5:
+            trend = 'BEARISH'
+
+    current_price = float(prices[-1])
+    if tick_count < 10:
+        support, resistance = current_price, current_price
+    else:
+        support, resistance = _support_resistance(window_prices)
+    volume_profile = _volume_profile(window_prices, volumes[i0:])
+
+    if upper_bb != lower_bb:
+        bb_position = (current_price - lower_bb) / (upper_bb - lower_bb)
+    else:
+        bb_position = 0.5
+
+    # Hybrid volatility (needs at least 10 ticks)
+    if tick_count < 10:
+        std_vol, atr_vol, hybrid_vol = 0.0, 0.0, 0.0
+    else:
+        std_vol, atr_vol = volatility, atr_like
+        std_scaled = std_vol * 10.0
+        atr_scaled = atr_vol * 0.2
+        hybrid_vol = max(std_scaled, atr_scaled) if atr_scaled > 0 else std_scaled
+
+    return {
+        'timestamp': timestamp,
+        'current_price': current_price,
+        'vwap': vwap,
+        'volatility': volatility,
+        'momentum': momentum,
+        'bollinger_bands': {
+            'upper': upper_bb,
+            'middle': middle_bb,
+            'lower': lower_bb,
+            'position': bb_position  # 0 = lower band, 1 = upper band
+        },
+        'bid_ask_spread': spread,
+        'trend': trend,
+        'support': support,
+        'resistance': resistance,
+        'volume_profile': volume_profile,
+        'tick_count': tick_count,
+        'std_volatility': std_vol,
+        'atr_volatility': atr_vol,
+        'hybrid_volatility': hybrid_vol
+    }
+
+
+def _copy_summary(summary: dict) -> dict:
+    """Independent copy of a tick summary (its nested dicts hold only scalars)"""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in summary.items()}
+
+
 class TickIndicators:
     """Technical indicators calculated from tick data only
 
@@ -37,30 +426,20 @@ class TickIndicators:
         Uses 24h volume as weight since tick-level volume not available.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds (default: 1 hour)
 
         Returns:
             VWAP value
         """
-        if not ticks:
+        if not len(ticks):
             return 0.0
 
-        # Filter ticks within lookback window
-        cutoff_time = ticks[-1].timestamp - timedelta(seconds=lookback_seconds)
-        recent_ticks = [t for t in ticks if t.timestamp >= cutoff_time]
-
-        if not recent_ticks:
-            return ticks[-1].price
-
-        # Volume-weighted calculation
-        total_volume = sum(t.volume_24h for t in recent_ticks)
-        if total_volume == 0:
-            # Fallback to simple average if no volume data
-            return sum(t.price for t in recent_ticks) / len(recent_ticks)
+        # Ticks within lookback window (always includes the last tick)
+        _, (prices, volumes) = _window_columns(ticks, lookback_seconds, ('price', 'volume_24h'))
 
-        vwap = sum(t.price * t.volume_24h for t in recent_ticks) / total_volume
-        return vwap
+        # Volume-weighted (simple average if no volume data)
+        return _vwap(prices, volumes)
 
     @staticmethod
     def calculate_time_weighted_average(
@@ -73,22 +452,17 @@ class TickIndicators:
         Gives equal weight to all ticks within time window.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds
 
         Returns:
             TWAP value
         """
-        if not ticks:
+        if not len(ticks):
             return 0.0
 
-        cutoff_time = ticks[-1].timestamp - timedelta(seconds=lookback_seconds)
-        recent_ticks = [t for t in ticks if t.timestamp >= cutoff_time]
-
-        if not recent_ticks:
-            return ticks[-1].price
-
-        return sum(t.price for t in recent_ticks) / len(recent_ticks)
+        _, (prices,) = _window_columns(ticks, lookback_seconds, ('price',))
+        return float(prices.mean())
 
     @staticmethod
     def calculate_tick_volatility(
@@ -101,7 +475,7 @@ class TickIndicators:
         NO high/low/close assumption - uses tick-to-tick changes only.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds
 
         Returns:
@@ -110,22 +484,9 @@ class TickIndicators:
         if len(ticks) < 2:
             return 0.0
 
-        # Filter ticks within lookback window
-        cutoff_time = ticks[-1].timestamp - timedelta(seconds=lookback_seconds)
-        recent_ticks = [t for t in ticks if t.timestamp >= cutoff_time]
-
-        if len(recent_ticks) < 2:
-            return 0.0
-
-        # Calculate tick-to-tick price changes
-        price_changes = [
-            abs(recent_ticks[i].price - recent_ticks[i-1].price)
-            for i in range(1, len(recent_ticks))
-        ]
-
-        # Standard deviation of changes
-        volatility = np.std(price_changes) if price_changes else 0.0
-        return volatility
+        # Standard deviation of tick-to-tick changes within lookback window
+        _, (prices,) = _window_columns(ticks, lookback_seconds, ('price',))
+        return _tick_volatility(prices)
 
     @staticmethod
     def calculate_atr_like_volatility(
@@ -141,7 +502,7 @@ class TickIndicators:
         This matches the scale of candle-based ATR better than standard deviation.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds
             window_size: Number of ticks per sub-window
 
@@ -151,24 +512,9 @@ class TickIndicators:
         if len(ticks) < window_size:
             return 0.0
 
-        # Filter ticks within lookback window
-        cutoff_time = ticks[-1].timestamp - timedelta(seconds=lookback_seconds)
-        recent_ticks = [t for t in ticks if t.timestamp >= cutoff_time]
-
-        if len(recent_ticks) < window_size:
-            return 0.0
-
-        # Calculate high-low range for each window
-        ranges = []
-        for i in range(0, len(recent_ticks) - window_size, window_size):
-            window = recent_ticks[i:i+window_size]
-            high = max(t.price for t in window)
-            low = min(t.price for t in window)
-            ranges.append(high - low)
-
-        # Average of ranges (similar to ATR)
-        atr_like = np.mean(ranges) if ranges else 0.0
-        return atr_like
+        # Average high-low range of window_size blocks (similar to ATR)
+        _, (prices,) = _window_columns(ticks, lookback_seconds, ('price',))
+        return _atr_like_volatility(prices, window_size)
 
     @staticmethod
     def calculate_hybrid_volatility(
@@ -184,7 +530,7 @@ class TickIndicators:
         Std dev was 10x too small, causing hybrid to be too low for signal generation.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds
 
         Returns:
@@ -223,7 +569,7 @@ class TickIndicators:
         Positive = upward momentum, Negative = downward momentum.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds
 
         Returns:
@@ -232,29 +578,21 @@ class TickIndicators:
         if len(ticks) < 2:
             return 0.0
 
-        cutoff_time = ticks[-1].timestamp - timedelta(seconds=lookback_seconds)
-        recent_ticks = [t for t in ticks if t.timestamp >= cutoff_time]
-
-        if len(recent_ticks) < 2:
-            return 0.0
-
-        # Price change over time window
-        start_price = recent_ticks[0].price
-        end_price = recent_ticks[-1].price
+        # Price change over time window (only its first and last tick)
+        if hasattr(ticks, 'ts_ns'):
+            time_elapsed, (prices,) = _window_columns(ticks, lookback_seconds, ('price',))
+            start_price, end_price = prices[0], prices[-1]
+        else:
+            recent_ticks = _window_ticks(ticks, lookback_seconds)
+            time_elapsed = (recent_ticks[-1].timestamp - recent_ticks[0].timestamp).total_seconds()
+            start_price, end_price = recent_ticks[0].price, recent_ticks[-1].price
 
-        if start_price == 0:
+        if start_price == 0 or time_elapsed == 0:
             return 0.0
 
-        # Percentage change
+        # Percentage change, normalized by time (momentum per second)
         pct_change = ((end_price - start_price) / start_price) * 100
-
-        # Normalize by time (momentum per second)
-        time_elapsed = (recent_ticks[-1].timestamp - recent_ticks[0].timestamp).total_seconds()
-        if time_elapsed == 0:
-            return 0.0
-
-        momentum = pct_change / time_elapsed
-        return momentum
+        return float(pct_change / time_elapsed)
 
     @staticmethod
     def calculate_tick_bollinger_bands(
@@ -272,22 +610,25 @@ class TickIndicators:
         causing BB position to go out of 0-1 range.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds
             num_std: Number of standard deviations for bands
 
         Returns:
             (upper_band, middle_band, lower_band)
         """
-        if not ticks:
+        if not len(ticks):
             return 0.0, 0.0, 0.0
 
+        # One window slice feeds both the middle band and the width
+        _, (prices, volumes) = _window_columns(ticks, lookback_seconds, ('price', 'volume_24h'))
+
         # Middle band = VWAP
-        middle = TickIndicators.calculate_vwap(ticks, lookback_seconds)
+        middle = _vwap(prices, volumes)
 
         # Band width = ATR-like volatility (FIXED: was using std dev)
         # ATR-like (~$10) creates proper width bands vs std dev (~$0.16)
-        volatility = TickIndicators.calculate_atr_like_volatility(ticks, lookback_seconds)
+        volatility = _atr_like_volatility(prices)
 
         # Upper/lower bands
         upper = middle + (num_std * volatility)
@@ -303,21 +644,58 @@ class TickIndicators:
         Candle data doesn't have this information.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
 
         Returns:
             Average spread as percentage of price
         """
-        if not ticks:
+        if not len(ticks):
             return 0.0
 
-        spreads = [
-            ((t.ask - t.bid) / t.price) * 100
-            for t in ticks
-            if t.price > 0
-        ]
+        fields = ('price', 'bid', 'ask')
+        if hasattr(ticks, 'ts_ns'):
+            return _bid_ask_spread(*(ticks.column(f) for f in fields))
+        return _bid_ask_spread(*(
+            np.fromiter(map(attrgetter(f), ticks), np.float64, len(ticks))
+            for f in fields
+        ))
 
-        return np.mean(spreads) if spreads else 0.0
+    @staticmethod
+    def calculate_multi_window_vwap(
+        ticks: List,
+        windows: Tuple[int, ...] = (60, 300, 900, 1800)
+    ) -> Dict[int, float]:
+        """VWAP over several lookback windows in one pass
+
+        Args:
+            ticks: List of Tick objects (or a TickRing)
+            windows: Lookback windows in seconds
+
+        Returns:
+            {window_seconds: VWAP}
+        """
+        if not len(ticks):
+            return {window: 0.0 for window in windows}
+
+        if hasattr(ticks, 'ts_ns'):
+            ts_ns = ticks.column('ts_ns')
+            starts = [_window_start(ts_ns, window) for window in windows]
+            n = len(ts_ns) - min(starts)
+            prices, volumes = ticks.column('price', n), ticks.column('volume_24h', n)
+            starts = [start - (len(ts_ns) - n) for start in starts]
+        else:
+            current_time = ticks[-1].timestamp
+            starts = [
+                bisect_left(ticks, current_time - timedelta(seconds=window), key=_timestamp)
+                for window in windows
+            ]
+            first = min(starts)
+            recent = ticks[first:]
+            prices = np.fromiter(map(attrgetter('price'), recent), np.float64, len(recent))
+            volumes = np.fromiter(map(attrgetter('volume_24h'), recent), np.float64, len(recent))
+            starts = [start - first for start in starts]
+
+        return dict(zip(windows, _window_vwaps(prices, volumes, starts)))
 
     @staticmethod
     def calculate_tick_trend(
@@ -331,7 +709,7 @@ class TickIndicators:
         Replaces MACD crossover logic.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             short_window: Short-term window in seconds
             long_window: Long-term window in seconds
 
@@ -342,8 +720,8 @@ class TickIndicators:
             return 'NEUTRAL'
 
         # Calculate VWAPs
-        short_vwap = TickIndicators.calculate_vwap(ticks, short_window)
-        long_vwap = TickIndicators.calculate_vwap(ticks, long_window)
+        vwaps = TickIndicators.calculate_multi_window_vwap(ticks, (short_window, long_window))
+        short_vwap, long_vwap = vwaps[short_window], vwaps[long_window]
 
         if short_vwap == 0 or long_vwap == 0:
             return 'NEUTRAL'
@@ -370,7 +748,7 @@ class TickIndicators:
         Uses tick density, not candle high/low.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds
             tolerance: Price clustering tolerance (fraction)
 
@@ -378,38 +756,12 @@ class TickIndicators:
             (support_level, resistance_level)
         """
         if len(ticks) < 10:
-            current_price = ticks[-1].price if ticks else 0
-            return current_price, current_price
-
-        # Filter recent ticks
-        cutoff_time = ticks[-1].timestamp - timedelta(seconds=lookback_seconds)
-        recent_ticks = [t for t in ticks if t.timestamp >= cutoff_time]
-
-        if not recent_ticks:
-            current_price = ticks[-1].price
+            current_price = _last_price(ticks) if len(ticks) else 0
             return current_price, current_price
 
-        # Get price range
-        prices = [t.price for t in recent_ticks]
-        current_price = recent_ticks[-1].price
-
-        # Find support (price below current where ticks cluster)
-        support_candidates = [p for p in prices if p < current_price]
-        if support_candidates:
-            # Most common price below current (with tolerance)
-            support = np.percentile(support_candidates, 25)  # 25th percentile
-        else:
-            support = current_price * 0.99
-
-        # Find resistance (price above current where ticks cluster)
-        resistance_candidates = [p for p in prices if p > current_price]
-        if resistance_candidates:
-            # Most common price above current (with tolerance)
-            resistance = np.percentile(resistance_candidates, 75)  # 75th percentile
-        else:
-            resistance = current_price * 1.01
-
-        return support, resistance
+        # 25th percentile below / 75th percentile above the current price
+        _, (prices,) = _window_columns(ticks, lookback_seconds, ('price',))
+        return _support_resistance(prices)
 
     @staticmethod
     def calculate_tick_volume_profile(
@@ -423,123 +775,362 @@ class TickIndicators:
         Tick data advantage: can see true volume distribution.
 
         Args:
-            ticks: List of Tick objects
+            ticks: List of Tick objects (or a TickRing)
             lookback_seconds: Time window in seconds
             num_bins: Number of price bins
 
         Returns:
             Dictionary with volume distribution
         """
-        if not ticks:
+        if not len(ticks):
             return {}
 
-        # Filter recent ticks
-        cutoff_time = ticks[-1].timestamp - timedelta(seconds=lookback_seconds)
-        recent_ticks = [t for t in ticks if t.timestamp >= cutoff_time]
+        # Histogram of volume by price, Point of Control, 70% Value Area
+        _, (prices, volumes) = _window_columns(ticks, lookback_seconds, ('price', 'volume_24h'))
+        return _volume_profile(prices, volumes, num_bins)
 
-        if not recent_ticks:
+    @staticmethod
+    def generate_tick_summary(ticks: List, lookback_seconds: int = 3600) -> dict:
+        """Generate comprehensive tick-based indicator summary
+
+        All indicators come from one fused pass (_window_stats_kernel) over
+        the lookback windows instead of each indicator re-reading the ticks.
+
+        For a TickRing the result is memoised on the ring itself and reused
+        until its next write (live loops poll faster than ticks arrive).
+        Each call returns its own copy, so callers may modify it.
+
+        Args:
+            ticks: List of Tick objects (or a TickRing)
+            lookback_seconds: Time window in seconds
+
+        Returns:
+            Dictionary with all indicators
+        """
+        if not len(ticks):
             return {}
 
-        # Create price bins
-        prices = [t.price for t in recent_ticks]
-        volumes = [t.volume_24h for t in recent_ticks]
+        if not hasattr(ticks, 'ts_ns'):
+            return TickIndicators._generate_tick_summary(ticks, lookback_seconds)
 
-        min_price = min(prices)
-        max_price = max(prices)
+        cached = ticks.summary_cache
+        if cached is not None and cached[0] == ticks.version and cached[1] == lookback_seconds:
+            return _copy_summary(cached[2])
 
-        if min_price == max_price:
-            return {
-                'poc': recent_ticks[-1].price,  # Point of Control
-                'value_area_high': recent_ticks[-1].price,
-                'value_area_low': recent_ticks[-1].price
-            }
+        summary = TickIndicators._generate_tick_summary(ticks, lookback_seconds)
+        ticks.summary_cache = (ticks.version, lookback_seconds, summary)
+        return _copy_summary(summary)
 
-        # Histogram of volume by price
-        hist, bin_edges = np.histogram(prices, bins=num_bins, weights=volumes)
+    @staticmethod
+    def _generate_tick_summary(ticks: List, lookback_seconds: int) -> dict:
+        """generate_tick_summary without the cache"""
+        if hasattr(ticks, 'ts_ns'):  # TickRing: already columnar
+            return TickIndicators.generate_tick_summary_arrays(
+                ticks.column('price'), ticks.column('ts_ns'), ticks.column('volume_24h'),
+                ticks.column('bid'), ticks.column('ask'), lookback_seconds
+            )
+
+        # Window starts by binary search; only ticks from the earliest are read
+        current_time = ticks[-1].timestamp
+        i0, s0, l0 = (
+            bisect_left(ticks, current_time - timedelta(seconds=seconds), key=_timestamp)
+            for seconds in (lookback_seconds, 300, 1800)  # lookback, trend 5/30 min
+        )
+        start = min(i0, s0, l0)
+        window = ticks[start:]
+        prices = np.fromiter(map(attrgetter('price'), window), np.float64, len(window))
+        volumes = np.fromiter(map(attrgetter('volume_24h'), window), np.float64, len(window))
+
+        # Recent spread (last 100 ticks)
+        recent = ticks[-100:]
+        spread = _bid_ask_spread(*(
+            np.fromiter(map(attrgetter(field), recent), np.float64, len(recent))
+            for field in ('price', 'bid', 'ask')
+        ))
+
+        summary = _tick_summary(
+            prices, volumes, i0 - start, s0 - start, l0 - start,
+            (current_time - ticks[i0].timestamp).total_seconds(),
+            spread, current_time.isoformat(), len(ticks)
+        )
+        for key in ('std_volatility', 'atr_volatility', 'hybrid_volatility'):
+            del summary[key]
+        return summary
 
-        # Point of Control (price with highest volume)
-        poc_idx = np.argmax(hist)
-        poc = (bin_edges[poc_idx] + bin_edges[poc_idx + 1]) / 2
 
-        # Value Area (70% of volume)
-        total_volume = sum(hist)
-        target_volume = total_volume * 0.70
+    @staticmethod
+    def calculate_tick_volatility_arrays(
+        prices: np.ndarray,
+        ts_ns: np.ndarray,
+        lookback_seconds: int = 3600
+    ) -> float:
+        """Array version of calculate_tick_volatility
 
-        # Find value area around POC
-        cumsum = 0
-        low_idx = poc_idx
-        high_idx = poc_idx
+        Args:
+            prices: Tick prices (float64)
+            ts_ns: Tick timestamps as int64 nanoseconds, ascending
+            lookback_seconds: Time window in seconds
 
-        while cumsum < target_volume and (low_idx > 0 or high_idx < len(hist) - 1):
-            if low_idx > 0:
-                cumsum += hist[low_idx - 1]
-                low_idx -= 1
-            if high_idx < len(hist) - 1 and cumsum < target_volume:
-                cumsum += hist[high_idx + 1]
-                high_idx += 1
+        Returns:
+            Volatility value (standard deviation of price changes)
+        """
+        if len(prices) < 2:
+            return 0.0
+        return _tick_volatility(prices[_window_start(ts_ns, lookback_seconds):])
 
-        value_area_low = bin_edges[low_idx]
-        value_area_high = bin_edges[high_idx + 1]
+    @staticmethod
+    def calculate_hybrid_volatility_arrays(
+        prices: np.ndarray,
+        ts_ns: np.ndarray,
+        lookback_seconds: int = 600
+    ) -> Tuple[float, float, float]:
+        """Array version of calculate_hybrid_volatility
 
-        return {
-            'poc': poc,
-            'value_area_high': value_area_high,
-            'value_area_low': value_area_low,
-            'volume_distribution': list(hist),
-            'price_bins': list(bin_edges)
-        }
+        Args:
+            prices: Tick prices (float64)
+            ts_ns: Tick timestamps as int64 nanoseconds, ascending
+            lookback_seconds: Time window in seconds
+
+        Returns:
+            (std_volatility, atr_volatility, hybrid_volatility)
+        """
+        if len(prices) < 10:
+            return 0.0, 0.0, 0.0
+
+        window = prices[_window_start(ts_ns, lookback_seconds):]
+        std_vol = _tick_volatility(window)
+        atr_vol = _atr_like_volatility(window)
+
+        std_scaled = std_vol * 10.0
+        atr_scaled = atr_vol * 0.2
+        hybrid_vol = max(std_scaled, atr_scaled) if atr_scaled > 0 else std_scaled
+
+        return std_vol, atr_vol, hybrid_vol
 
     @staticmethod
-    def generate_tick_summary(ticks: List, lookback_seconds: int = 3600) -> dict:
-        """Generate comprehensive tick-based indicator summary
+    def generate_tick_summary_arrays(
+        prices: np.ndarray,
+        ts_ns: np.ndarray,
+        volumes: np.ndarray,
+        bids: np.ndarray,
+        asks: np.ndarray,
+        lookback_seconds: int = 3600
+    ) -> dict:
+        """Array version of generate_tick_summary (same keys)
 
         Args:
-            ticks: List of Tick objects
+            prices: Tick prices (float64)
+            ts_ns: Tick timestamps as int64 nanoseconds, ascending
+            volumes: 24h volume per tick (VWAP weights)
+            bids: Best bid per tick
+            asks: Best ask per tick
             lookback_seconds: Time window in seconds
 
         Returns:
             Dictionary with all indicators
         """
-        if not ticks:
+        summary = TickIndicators.compute_all(prices, ts_ns, volumes, bids, asks, lookback_seconds)
+        for key in ('std_volatility', 'atr_volatility', 'hybrid_volatility'):
+            summary.pop(key, None)
+        return summary
+
+    @staticmethod
+    def compute_all(
+        prices: np.ndarray,
+        ts_ns: np.ndarray,
+        volumes: np.ndarray,
+        bids: np.ndarray,
+        asks: np.ndarray,
+        lookback_seconds: int = 600
+    ) -> dict:
+        """Tick summary and hybrid volatility from one fused pass
+
+        Equivalent to generate_tick_summary plus calculate_hybrid_volatility
+        on the same ticks, but VWAPs, volatility and the ATR-like range are
+        accumulated together by _window_stats_kernel instead of each
+        indicator re-reading the window.
+
+        Args:
+            prices: Tick prices (float64)
+            ts_ns: Tick timestamps as int64 nanoseconds, ascending
+            volumes: 24h volume per tick (VWAP weights)
+            bids: Best bid per tick
+            asks: Best ask per tick
+            lookback_seconds: Time window in seconds
+
+        Returns:
+            generate_tick_summary dictionary plus 'std_volatility',
+            'atr_volatility' and 'hybrid_volatility'
+        """
+        if len(prices) == 0:
             return {}
 
-        # Calculate all indicators
-        vwap = TickIndicators.calculate_vwap(ticks, lookback_seconds)
-        volatility = TickIndicators.calculate_tick_volatility(ticks, lookback_seconds)
-        momentum = TickIndicators.calculate_tick_momentum(ticks, lookback_seconds)
-        upper_bb, middle_bb, lower_bb = TickIndicators.calculate_tick_bollinger_bands(ticks, lookback_seconds)
-        spread = TickIndicators.calculate_bid_ask_spread(ticks[-100:])  # Recent spread
-        trend = TickIndicators.calculate_tick_trend(ticks)
-        support, resistance = TickIndicators.calculate_tick_support_resistance(ticks, lookback_seconds)
-        volume_profile = TickIndicators.calculate_tick_volume_profile(ticks, lookback_seconds)
-
-        current_price = ticks[-1].price
-        current_time = ticks[-1].timestamp
+        # Lookback windows (binary search on ascending timestamps)
+        i0 = _window_start(ts_ns, lookback_seconds)
+        s0 = _window_start(ts_ns, 300)   # trend: 5 minutes
+        l0 = _window_start(ts_ns, 1800)  # trend: 30 minutes
+
+        # Recent spread (last 100 ticks)
+        spread = _bid_ask_spread(prices[-100:], bids[-100:], asks[-100:])
 
-        # Bollinger Band position
-        if upper_bb != lower_bb:
-            bb_position = (current_price - lower_bb) / (upper_bb - lower_bb)
+        current_time = np.datetime64(int(ts_ns[-1]), 'ns').astype('datetime64[us]').item()
+
+        return _tick_summary(
+            prices, volumes, i0, s0, l0,
+            (ts_ns[-1] - ts_ns[i0]) / NS_PER_SECOND,
+            spread, current_time.isoformat(), len(prices)
+        )
+
+
+class StreamingTickIndicators:
+    """Time-windowed VWAP, TWAP, tick volatility and momentum, updated per tick
+
+    Keeps running sums over the ticks within lookback_seconds of the latest
+    one: each update adds one tick and evicts expired ones from the front,
+    so reading an indicator is O(1) instead of a pass over the window. The
+    sums are recomputed exactly every `resync_interval` updates so rounding
+    drift from the add/remove updates cannot accumulate.
+
+    The bid-ask spread follows generate_tick_summary and averages the last
+    `spread_ticks` ticks (by count, not time), skipping ticks with price <= 0.
+
+    Matches the List[Tick]/array indicators on the same window (to rounding).
+    """
+
+    __slots__ = (
+        'lookback_ns', 'resync_interval', 'buf', 'updates',
+        'sum_p', 'sum_v', 'sum_pv', 'sum_d', 'sum_d2',
+        'spreads', 'spread_sum', 'spread_count'
+    )
+
+    def __init__(
+        self,
+        lookback_seconds: int = 600,
+        resync_interval: int = 1000,
+        spread_ticks: int = 100
+    ):
+        self.lookback_ns = lookback_seconds * NS_PER_SECOND
+        self.resync_interval = resync_interval
+        self.buf = deque()  # (ts_ns, price, volume, |change from previous tick|)
+        self.updates = 0
+        self.sum_p = 0.0    # prices
+        self.sum_v = 0.0    # volumes
+        self.sum_pv = 0.0   # price * volume
+        self.sum_d = 0.0    # |changes| between consecutive window ticks
+        self.sum_d2 = 0.0   # squared |changes|
+        self.spreads = deque(maxlen=spread_ticks)  # spread %, None when price <= 0
+        self.spread_sum = 0.0
+        self.spread_count = 0
+
+    def update(self, ts_ns: int, price: float, volume: float, bid: float, ask: float):
+        """Add a tick (ascending ts_ns) and evict ticks older than the lookback"""
+        spreads = self.spreads
+        if len(spreads) == spreads.maxlen and spreads[0] is not None:
+            self.spread_sum -= spreads[0]
+            self.spread_count -= 1
+        if price > 0:
+            spread = (ask - bid) / price * 100
+            self.spread_sum += spread
+            self.spread_count += 1
         else:
-            bb_position = 0.5
+            spread = None
+        spreads.append(spread)
+
+        buf = self.buf
+        change = abs(price - buf[-1][1]) if buf else 0.0
+        if buf:
+            self.sum_d += change
+            self.sum_d2 += change * change
+        buf.append((ts_ns, price, volume, change))
+        self.sum_p += price
+        self.sum_v += volume
+        self.sum_pv += price * volume
+
+        # Evict from the front; the new first tick's change leaves the window
+        cutoff_ns = ts_ns - self.lookback_ns
+        while buf[0][0] < cutoff_ns:
+            _, old_price, old_volume, _ = buf.popleft()
+            self.sum_p -= old_price
+            self.sum_v -= old_volume
+            self.sum_pv -= old_price * old_volume
+            first_change = buf[0][3]
+            self.sum_d -= first_change
+            self.sum_d2 -= first_change * first_change
+
+        self.updates += 1
+        if self.updates % self.resync_interval == 0:
+            self._resync()
+
+    def _resync(self):
+        """Recompute all sums from the window"""
+        changes = [entry[3] for entry in self.buf][1:]
+        self.sum_p = sum(entry[1] for entry in self.buf)
+        self.sum_v = sum(entry[2] for entry in self.buf)
+        self.sum_pv = sum(entry[1] * entry[2] for entry in self.buf)
+        self.sum_d = sum(changes)
+        self.sum_d2 = sum(d * d for d in changes)
+        valid_spreads = [spread for spread in self.spreads if spread is not None]
+        self.spread_sum = sum(valid_spreads)
+        self.spread_count = len(valid_spreads)
+
+    def __len__(self) -> int:
+        return len(self.buf)
+
+    def vwap(self) -> float:
+        """VWAP of the window (simple average when volume is zero)"""
+        if not self.buf:
+            return 0.0
+        if self.sum_v == 0:
+            return self.sum_p / len(self.buf)
+        return self.sum_pv / self.sum_v
+
+    def twap(self) -> float:
+        """Average price of the window"""
+        return self.sum_p / len(self.buf) if self.buf else 0.0
+
+    def volatility(self) -> float:
+        """Population std of |tick-to-tick changes| in the window"""
+        n = len(self.buf) - 1
+        if n <= 0:
+            return 0.0
+        mean = self.sum_d / n
+        return max(self.sum_d2 / n - mean * mean, 0.0) ** 0.5
+
+    def momentum(self) -> float:
+        """Percentage change per second across the window"""
+        if len(self.buf) < 2:
+            return 0.0
+        first_ts, first_price = self.buf[0][:2]
+        last_ts, last_price = self.buf[-1][:2]
+        time_elapsed = (last_ts - first_ts) / NS_PER_SECOND
+        if first_price == 0 or time_elapsed == 0:
+            return 0.0
+        return ((last_price - first_price) / first_price) * 100 / time_elapsed
 
+    def bid_ask_spread(self) -> float:
+        """Average spread as percentage of price over the last spread_ticks ticks"""
+        return self.spread_sum / self.spread_count if self.spread_count else 0.0
+
+    def snapshot(self) -> dict:
+        """The generate_tick_summary keys that stream in O(1)
+
+        Bands, support/resistance and the volume profile need the whole
+        window; use generate_tick_summary for those. As there, tick_count
+        is the length of the full series (every tick passed to update()),
+        not of the lookback window; len() gives the window size.
+        """
+        if not self.buf:
+            return {}
+        last_ts, last_price = self.buf[-1][:2]
+        current_time = np.datetime64(int(last_ts), 'ns').astype('datetime64[us]').item()
         return {
             'timestamp': current_time.isoformat(),
-            'current_price': current_price,
-            'vwap': vwap,
-            'volatility': volatility,
-            'momentum': momentum,
-            'bollinger_bands': {
-                'upper': upper_bb,
-                'middle': middle_bb,
-                'lower': lower_bb,
-                'position': bb_position  # 0 = lower band, 1 = upper band
-            },
-            'bid_ask_spread': spread,
-            'trend': trend,
-            'support': support,
-            'resistance': resistance,
-            'volume_profile': volume_profile,
-            'tick_count': len(ticks)
+            'current_price': last_price,
+            'vwap': self.vwap(),
+            'volatility': self.volatility(),
+            'momentum': self.momentum(),
+            'bid_ask_spread': self.bid_ask_spread(),
+            'tick_count': self.updates
         }
 
 
@@ -12,9 +12,14 @@ from pathlib import Path
 from technical_indicators import TechnicalIndicators
 from tick_indicators import TickIndicators
 from ml_engine import MLEngine
+from _strategy_kernel import straddle_score
 
 logger = logging.getLogger(__name__)
 
+# Signal names indexed by signal value + 1 (-1 SELL, 0 HOLD, 1 BUY, 2 BOTH)
+_SIGNAL_NAMES = ('SELL', 'HOLD', 'BUY', 'BOTH')
+_SIGNAL_NAME_ARRAY = np.array(_SIGNAL_NAMES)
+
 class TradingStrategy:
     """Hybrid trading strategy combining technical analysis and ML predictions"""
 
@@ -38,8 +43,8 @@ class TradingStrategy:
         # Load coin-specific parameters
         self.coin_params = self._load_coin_parameters()
 
-        logger.info(f"TradingStrategy initialized: ML weight={ml_weight}, Technical weight={technical_weight}")
-        logger.info(f"Loaded parameters for {len(self.coin_params.get('coin_parameters', {}))} coins")
+        logger.info("TradingStrategy initialized: ML weight=%s, Technical weight=%s", ml_weight, technical_weight)
+        logger.info("Loaded parameters for %d coins", len(self.coin_params.get('coin_parameters', {})))
 
     def _load_coin_parameters(self) -> Dict:
         """Load coin-specific parameters from JSON file"""
@@ -48,10 +53,10 @@ class TradingStrategy:
         try:
             with open(params_file, 'r') as f:
                 params = json.load(f)
-            logger.info(f"Loaded coin-specific parameters from {params_file}")
+            logger.info("Loaded coin-specific parameters from %s", params_file)
             return params
         except FileNotFoundError:
-            logger.warning(f"Coin parameters file not found: {params_file}, using defaults")
+            logger.warning("Coin parameters file not found: %s, using defaults", params_file)
             return {
                 'coin_parameters': {},
                 'fallback_parameters': {
@@ -62,7 +67,7 @@ class TradingStrategy:
                 }
             }
         except Exception as e:
-            logger.error(f"Error loading coin parameters: {e}")
+            logger.error("Error loading coin parameters: %s", e)
             return {
                 'coin_parameters': {},
                 'fallback_parameters': {
@@ -94,7 +99,7 @@ class TradingStrategy:
                 'hard_stop': 0.015,
                 'trailing_multiplier': 2.0
             })
-            logger.info(f"Using fallback parameters for {symbol}")
+            logger.info("Using fallback parameters for %s", symbol)
             return fallback
 
     def set_ml_engine(self, ml_engine: MLEngine):
@@ -147,33 +152,21 @@ class TradingStrategy:
             return 0, 0.0
 
         # Get coin-specific parameters
-        if symbol:
-            params = self.get_coin_parameters(symbol)
-            bb_threshold = params.get('bb_compression', 0.055)
-            atr_threshold = params.get('atr_expansion', 0.025)
-        else:
-            # Fallback to default
-            bb_threshold = 0.055
-            atr_threshold = 0.025
+        bb_threshold, atr_threshold = self._signal_thresholds(symbol)
 
         # === VOLATILITY COMPRESSION DETECTION ===
         # BB Width calculation
         bb_width = (upper_band - lower_band) / middle_band
 
-        # Coin-specific compression threshold
-        is_compressed = bb_bandwidth < bb_threshold
-
         # === VOLATILITY EXPANSION DETECTION ===
         # Approximation: Use ATR relative to price
         atr_pct = atr / close if close > 0 else 0
-        # Coin-specific expansion threshold
-        is_expanding = atr_pct > atr_threshold
 
         # === VOLUME FILTER (v5.0 - DISABLED) ===
         # NOTE: avg_volume not calculated in technical_indicators.py yet
         # TODO: Implement avg_volume calculation before enabling
         # For now, bypass volume filter to test Dynamic Hard Stop alone
-        has_volume = True  # Always pass volume filter for now
+        # (see _strategy_kernel.straddle_score)
 
         # # Future implementation:
         # volume = indicators.get('volume', 0)
@@ -191,45 +184,78 @@ class TradingStrategy:
         # This is a simplified version - will need enhancement in backtester
 
         # === SIGNAL GENERATION ===
-        signal = 0
-        strength = 0.0
+        return straddle_score(float(bb_bandwidth), float(atr_pct), float(bb_threshold), float(atr_threshold))
+
+    def analyze_technical_signals_batch(self,
+                                        bb_bandwidth: np.ndarray,
+                                        bb_middle: np.ndarray,
+                                        atr: np.ndarray,
+                                        close: np.ndarray,
+                                        symbol: str = None) -> Tuple[np.ndarray, np.ndarray]:
+        """analyze_technical_signals over whole indicator columns
+
+        Same entry rule and strength as the per-bar method, evaluated with
+        array operations so a backtest can score its full history at once.
+        Rows with missing (NaN) indicators get no signal.
 
-        # TWO-WAY ONLY STRATEGY: Only enter both sides simultaneously
-        # Do NOT use traditional BUY/SELL signals
+        Args:
+            bb_bandwidth: Bollinger bandwidth per bar
+            bb_middle: Bollinger middle band per bar
+            atr: ATR per bar
+            close: Close price per bar
+            symbol: Trading symbol for coin-specific parameters
+
+        Returns:
+            (signals, strengths): 2 (BOTH) or 0 (HOLD) per bar, strength 0-1
+        """
+        bb_bandwidth = np.asarray(bb_bandwidth, dtype=np.float64)
+        bb_middle = np.asarray(bb_middle, dtype=np.float64)
+        atr = np.asarray(atr, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
 
-        # Entry signal: Volatility compression → expansion + volume confirmation (v5.0)
-        if is_compressed and is_expanding and has_volume:
-            signal = 2  # Special code: BOTH (LONG + SHORT simultaneously)
+        bb_threshold, atr_threshold = self._signal_thresholds(symbol)
 
-            # Calculate strength based on:
-            # - Degree of compression (tighter = stronger)
-            # - Degree of expansion (larger ATR = stronger)
-            # - Combination confidence
+        with np.errstate(divide='ignore', invalid='ignore'):
+            atr_pct = np.where(close > 0, atr / close, 0.0)
 
-            # Use coin-specific thresholds for strength calculation (v4.0 fix)
-            # This ensures low-ATR coins (BTC, ETH) get proper strength scores
-            compression_strength = max(0, (bb_threshold - bb_bandwidth) / bb_threshold) if bb_threshold > 0 else 0
-            expansion_strength = min(atr_pct / atr_threshold, 1.0) if atr_threshold > 0 else 0
+            # Compression + expansion (middle band 0 = no indicator data)
+            entry = (bb_middle != 0) & (bb_bandwidth < bb_threshold) & (atr_pct > atr_threshold)
 
-            # Combine signals (equal weight)
-            strength = (compression_strength * 0.5 + expansion_strength * 0.5)
+            if bb_threshold > 0:
+                compression_strength = np.maximum(0, (bb_threshold - bb_bandwidth) / bb_threshold)
+            else:
+                compression_strength = np.zeros_like(bb_bandwidth)
+            if atr_threshold > 0:
+                expansion_strength = np.minimum(atr_pct / atr_threshold, 1.0)
+            else:
+                expansion_strength = np.zeros_like(atr_pct)
 
-            # Boost strength if both conditions are very strong
-            if compression_strength > 0.7 and expansion_strength > 0.7:
-                strength = min(strength * 1.2, 1.0)
+        strength = compression_strength * 0.5 + expansion_strength * 0.5
+        strong = (compression_strength > 0.7) & (expansion_strength > 0.7)
+        strength = np.where(strong, np.minimum(strength * 1.2, 1.0), strength)
 
-        # NOTE: signal = 0 (HOLD) if conditions not met
-        # NO traditional BUY (1) or SELL (-1) signals in this strategy
+        signals = np.where(entry, 2, 0)
+        strengths = np.where(entry, np.minimum(strength, 1.0), 0.0)
+        return signals, strengths
 
-        return signal, min(strength, 1.0)
+    def _signal_thresholds(self, symbol: Optional[str]) -> Tuple[float, float]:
+        """(bb_compression, atr_expansion) thresholds for a symbol"""
+        if symbol:
+            params = self.get_coin_parameters(symbol)
+            return params.get('bb_compression', 0.055), params.get('atr_expansion', 0.025)
+        # Fallback to default
+        return 0.055, 0.025
 
-    def generate_signal(self, data: pd.DataFrame, indicators: Dict, symbol: str = None) -> Dict:
+    def generate_signal(self, data: pd.DataFrame, indicators: Dict, symbol: str = None,
+                        timestamp=None) -> Dict:
         """Generate trading signal combining technical and ML analysis
 
         Args:
             data: OHLCV dataframe
             indicators: Technical indicators dictionary
             symbol: Trading symbol (e.g., 'BTC/USDT') for coin-specific parameters
+            timestamp: Signal time (e.g. the bar's time when replaying history);
+                defaults to now as an ISO string
 
         Returns:
             Signal dictionary with recommendation and details
@@ -240,11 +266,11 @@ class TradingStrategy:
         # Get ML prediction if available
         ml_signal = 0
         ml_confidence = 0.0
-        if self.ml_engine and self.ml_engine.rf_model is not None:
+        if self.ml_engine and self.ml_engine.can_predict(data):
             try:
                 ml_signal, ml_confidence = self.ml_engine.predict(data, indicators)
             except Exception as e:
-                logger.warning(f"ML prediction failed: {e}")
+                logger.warning("ML prediction failed: %s", e)
                 ml_signal = 0
                 ml_confidence = 0.0
 
@@ -276,31 +302,78 @@ class TradingStrategy:
                 signal_source = "hybrid"
 
         # Signal interpretation
-        signal_map = {2: 'BOTH', 1: 'BUY', 0: 'HOLD', -1: 'SELL'}
-
         return {
-            'signal': signal_map[final_signal],
+            'signal': _SIGNAL_NAMES[final_signal + 1],
             'signal_value': final_signal,
             'confidence': final_confidence,
             'source': signal_source,
             'technical': {
-                'signal': signal_map[tech_signal],
+                'signal': _SIGNAL_NAMES[tech_signal + 1],
                 'strength': tech_strength
             },
             'ml': {
-                'signal': signal_map[ml_signal],
+                'signal': _SIGNAL_NAMES[ml_signal + 1],
                 'confidence': ml_confidence
             },
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp if timestamp is not None else datetime.now().isoformat(),
             'indicators': {
                 'rsi': indicators.get('rsi', None),
                 'macd_histogram': indicators.get('macd', {}).get('histogram', None),
                 'bb_bandwidth': indicators.get('bb', {}).get('bandwidth', None),
                 'atr': indicators.get('atr', None),
-                'price': data['close'].iloc[-1] if not data.empty else None
+                'price': data['close'].to_numpy()[-1] if not data.empty else None
             }
         }
 
+    def generate_signals_batch(self, indicators_df: pd.DataFrame, symbol: str = None) -> pd.DataFrame:
+        """generate_signal for many bars at once (e.g. a whole backtest history)
+
+        Technical scores, ML predictions and their combination are computed
+        column-wise; the ML model runs once over all rows.
+
+        Args:
+            indicators_df: One row per bar with columns bb_bandwidth, bb_middle,
+                atr and close, plus the ML engine's feature columns (as built by
+                MLEngine.prepare_features) to include ML predictions
+            symbol: Trading symbol for coin-specific parameters
+
+        Returns:
+            DataFrame indexed like indicators_df with signal, signal_value,
+            confidence, source and the technical / ML components
+        """
+        tech_signal, tech_strength = self.analyze_technical_signals_batch(
+            indicators_df['bb_bandwidth'], indicators_df['bb_middle'],
+            indicators_df['atr'], indicators_df['close'], symbol
+        )
+
+        # ML predictions if available (and the features were supplied)
+        ml_signal = np.zeros(len(indicators_df), dtype=np.int64)
+        ml_confidence = np.zeros(len(indicators_df))
+        if (self.ml_engine and self.ml_engine.rf_model is not None
+                and set(self.ml_engine.feature_names).issubset(indicators_df.columns)):
+            try:
+                ml_signal, ml_confidence = self.ml_engine.predict_batch(indicators_df)
+            except Exception as e:
+                logger.warning("ML batch prediction failed: %s", e)
+
+        # Combine signals (same rules as generate_signal, per row)
+        combined_score = (ml_signal * ml_confidence * self.ml_weight +
+                          tech_signal * tech_strength * self.technical_weight)
+        hybrid_signal = (combined_score > 0.3).astype(np.int64) - (combined_score < -0.3)
+        technical = (ml_confidence < self.confidence_threshold) | (tech_signal == 2)
+        final_signal = np.where(technical, tech_signal, hybrid_signal)
+
+        return pd.DataFrame({
+            'signal': _SIGNAL_NAME_ARRAY[final_signal + 1],
+            'signal_value': final_signal,
+            'confidence': np.where(technical, tech_strength, np.abs(combined_score)),
+            'source': np.where(technical, 'technical', 'hybrid'),
+            'technical_signal': _SIGNAL_NAME_ARRAY[tech_signal + 1],
+            'technical_strength': tech_strength,
+            'ml_signal': _SIGNAL_NAME_ARRAY[ml_signal + 1],
+            'ml_confidence': ml_confidence
+        }, index=indicators_df.index)
+
     def should_trade(self, signal: Dict, min_confidence: float = 0.5) -> bool:
         """Determine if we should execute a trade based on signal
 
@@ -374,10 +447,8 @@ class TradingStrategy:
                     reason = f"High volatility ({vol_pct:.3%}) + BB middle ({bb_position:.2%})"
 
         # Signal interpretation
-        signal_map = {2: 'BOTH', 1: 'BUY', 0: 'HOLD', -1: 'SELL'}
-
         return {
-            'signal': signal_map[signal],
+            'signal': _SIGNAL_NAMES[signal + 1],
             'signal_value': signal,
             'confidence': confidence,
             'source': 'tick_based',
@@ -422,7 +493,7 @@ class RiskManager:
         self.daily_pnl = 0.0
         self.peak_balance = 0.0
 
-        logger.info(f"RiskManager initialized with max_position={max_position_size}")
+        logger.info("RiskManager initialized with max_position=%s", max_position_size)
 
     def calculate_position_size(self, balance: float, price: float,
                                 confidence: float) -> float:
@@ -436,17 +507,33 @@ class RiskManager:
         Returns:
             Position size in base currency
         """
+        return self.calculate_position_sizes(balance, price, confidence)
+
+    def calculate_position_sizes(self, balance, prices, confidences):
+        """calculate_position_size for many symbols at once (arrays or scalars)
+
+        Args:
+            balance: Available balance
+            prices: Current price per symbol
+            confidences: Signal confidence (0-1) per symbol
+
+        Returns:
+            Position sizes in base currency
+        """
         # Base position size
         max_investment = balance * self.max_position_size
 
         # Adjust by confidence (50% to 100% of max position)
-        confidence_factor = 0.5 + (confidence * 0.5)
+        confidence_factor = 0.5 + (confidences * 0.5)
         investment = max_investment * confidence_factor
 
         # Calculate position size
-        position_size = investment / price
+        return investment / prices
 
-        return position_size
+    @staticmethod
+    def position_direction(position_type: str) -> int:
+        """+1 for 'LONG', -1 for 'SHORT'"""
+        return 1 if position_type == 'LONG' else -1
 
     def check_stop_loss(self, entry_price: float, current_price: float,
                        position_type: str) -> bool:
@@ -460,12 +547,8 @@ class RiskManager:
         Returns:
             True if stop loss triggered
         """
-        if position_type == 'LONG':
-            loss_pct = (entry_price - current_price) / entry_price
-        else:  # SHORT
-            loss_pct = (current_price - entry_price) / entry_price
-
-        return loss_pct >= self.stop_loss_pct
+        return self.check_stop_losses(entry_price, current_price,
+                                      self.position_direction(position_type))
 
     def check_take_profit(self, entry_price: float, current_price: float,
                          position_type: str) -> bool:
@@ -479,12 +562,35 @@ class RiskManager:
         Returns:
             True if take profit triggered
         """
-        if position_type == 'LONG':
-            profit_pct = (current_price - entry_price) / entry_price
-        else:  # SHORT
-            profit_pct = (entry_price - current_price) / entry_price
+        return self.check_take_profits(entry_price, current_price,
+                                       self.position_direction(position_type))
+
+    def check_stop_losses(self, entry_prices, current_prices, directions):
+        """check_stop_loss for many positions at once (arrays or scalars)
 
-        return profit_pct >= self.take_profit_pct
+        Args:
+            entry_prices: Entry prices
+            current_prices: Current prices
+            directions: +1 LONG / -1 SHORT per position
+
+        Returns:
+            True where the stop loss is triggered
+        """
+        # Loss is the price move against the position, as a fraction of entry
+        return directions * (entry_prices - current_prices) / entry_prices >= self.stop_loss_pct
+
+    def check_take_profits(self, entry_prices, current_prices, directions):
+        """check_take_profit for many positions at once (arrays or scalars)
+
+        Args:
+            entry_prices: Entry prices
+            current_prices: Current prices
+            directions: +1 LONG / -1 SHORT per position
+
+        Returns:
+            True where the take profit is triggered
+        """
+        return directions * (current_prices - entry_prices) / entry_prices >= self.take_profit_pct
 
     def can_open_position(self, balance: float) -> bool:
         """Check if we can open new position based on risk limits
@@ -501,18 +607,53 @@ class RiskManager:
 
         # Check daily loss limit
         if self.daily_pnl < -(balance * self.daily_loss_limit):
-            logger.warning(f"Daily loss limit reached: {self.daily_pnl}")
+            logger.warning("Daily loss limit reached: %s", self.daily_pnl)
             return False
 
         # Check max drawdown
         if self.peak_balance > 0:
             current_drawdown = (self.peak_balance - balance) / self.peak_balance
             if current_drawdown >= self.max_drawdown:
-                logger.warning(f"Max drawdown reached: {current_drawdown:.2%}")
+                logger.warning("Max drawdown reached: %.2f%%", current_drawdown * 100)
                 return False
 
         return True
 
+    def can_open_positions(self, balances: np.ndarray) -> np.ndarray:
+        """can_open_position for a sequence of balance checks in one pass
+
+        Equivalent to calling can_open_position on each balance in order:
+        the peak balance seen so far is a running maximum, and each rejected
+        check logs the same warning the scalar call would.
+
+        Args:
+            balances: Balances, in check order
+
+        Returns:
+            Boolean array, True where a position can be opened
+        """
+        balances = np.asarray(balances, dtype=np.float64)
+        if balances.size == 0:
+            return np.zeros(0, dtype=bool)
+
+        peaks = np.maximum.accumulate(np.maximum(balances, self.peak_balance))
+        self.peak_balance = float(peaks[-1])
+
+        # Daily loss limit and max drawdown
+        loss_limited = self.daily_pnl < -(balances * self.daily_loss_limit)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdowns = np.where(peaks > 0, (peaks - balances) / peaks, 0.0)
+        drawdown_limited = (peaks > 0) & (drawdowns >= self.max_drawdown)
+
+        rejected = loss_limited | drawdown_limited
+        for i in np.flatnonzero(rejected).tolist():
+            if loss_limited[i]:
+                logger.warning("Daily loss limit reached: %s", self.daily_pnl)
+            else:
+                logger.warning("Max drawdown reached: %.2f%%", drawdowns[i] * 100)
+
+        return ~rejected
+
     def update_daily_pnl(self, pnl: float):
         """Update daily P&L tracking
 